@@ -1,9 +1,47 @@
 """Factory / base classes for Comparator and Operator classes."""
 
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
 
 class Comparator:
     """Abstract factory class for initializing Comparator objects."""
 
+    # Comparator subclasses by symbol, filled on class creation
+    _registry = {}
+
+    # Shared, stateless Comparator instances by symbol
+    _instances = {}
+
+    # Relative cost of comparing a column, cheaper comparisons run first
+    cost = 2
+
+    # Whether results per row depend on that row only, allowing comparisons
+    # on a subset of the rows
+    rowwise = True
+
+    # Data type all compared columns should match, for example "number",
+    # None to compare any data type
+    dtype = None
+
+    # Whether the Comparator accepts a dict of reductions of the data, such as
+    # ranks, which are reused when the same columns are compared again
+    reduces = False
+
+    # NumPy ufunc comparing numeric data to a target, such as np.equal. Only
+    # Comparators comparing numeric data on the raw array define it.
+    ufunc: np.ufunc
+
+    def __init_subclass__(cls, **kwargs):
+        """Registers a Comparator subclass defining its own symbol."""
+
+        super().__init_subclass__(**kwargs)
+        if "symbol" in cls.__dict__:
+            Comparator._registry[cls.symbol] = cls
+            Comparator._instances.pop(cls.symbol, None)
+
     @classmethod
     def get(cls, symbol):
         """
@@ -17,20 +55,218 @@ class Comparator:
         Returns
         -------
         Comparator
-            Instance of the requested Comparator subclass.
+            Shared instance of the requested Comparator subclass.
         """
 
-        symbols = {comp.symbol: comp for comp in cls.__subclasses__()}
-        if symbol not in symbols:
+        if symbol not in cls._registry:
             raise TypeError(f"Unknown Comparator: {symbol}.")
 
-        return symbols[symbol]()
+        if symbol not in cls._instances:
+            cls._instances[symbol] = cls._registry[symbol]()
+        return cls._instances[symbol]
 
     @classmethod
     def list(cls):
         """Returns a set of available Comparator symbols."""
 
-        return {comp.symbol for comp in cls.__subclasses__()}
+        return set(cls._registry)
+
+    def _apply_ufunc(self, df, target):
+        """
+        Compares numeric data to the target using the NumPy ufunc of the
+        Comparator, in one pass over the data array of each dtype.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Numeric data to compare, missing values compare as NaN.
+        target : Union[str, float, pandas.Series]
+            Target value, or Series to compare row by row.
+
+        Returns
+        -------
+        pandas.DataFrame
+            DataFrame with boolean comparison results.
+        """
+
+        if isinstance(target, pd.Series):
+            target = target.to_numpy(dtype=float, na_value=np.nan)[:, np.newaxis]
+        else:
+            target = float(target)
+
+        return self._compare_numeric(df, lambda _, values: self.ufunc(values, target))
+
+    def _apply_ufunc_numeric(self, df, target, compare):
+        """
+        Compares the numeric columns using the NumPy ufunc of the Comparator
+        and the other columns using a function, choosing per column so each
+        column is compared the same regardless of the other columns.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Data to compare.
+        target : Union[str, float]
+            Target value.
+        compare : Callable
+            Function comparing a DataFrame of the other columns to the target.
+
+        Returns
+        -------
+        pandas.DataFrame
+            DataFrame with boolean comparison results.
+        """
+
+        numeric = df.columns.isin(df.select_dtypes("number").columns)
+        if numeric.all():
+            return self._apply_ufunc(df, target)
+        if not numeric.any():
+            return compare(df, target)
+
+        compared = pd.concat(
+            [
+                self._apply_ufunc(df.loc[:, numeric], target),
+                compare(df.loc[:, ~numeric], target),
+            ],
+            axis=1,
+        )
+        return compared[df.columns]
+
+    @classmethod
+    def _compare_numeric(cls, df, compare):
+        """
+        Compares numeric data block by block, one block per dtype, so each
+        column is compared the same regardless of the other columns.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Numeric data to compare, missing values compare as NaN.
+        compare : Callable
+            Function taking the positions of the columns in a block and the
+            2D array of their values, returning a boolean array of the same
+            shape.
+
+        Returns
+        -------
+        pandas.DataFrame
+            DataFrame with boolean comparison results.
+        """
+
+        blocks = cls.numeric_blocks(df)
+        if len(blocks) == 1:
+            result = compare(*blocks[0])
+        else:
+            result = np.empty(df.shape, dtype=bool)
+            for positions, values in blocks:
+                result[:, positions] = compare(positions, values)
+
+        return pd.DataFrame(result, index=df.index, columns=df.columns)
+
+    @staticmethod
+    def numeric_blocks(df):
+        """
+        Splits numeric data into data arrays per dtype. Columns with a NumPy
+        numeric dtype keep that dtype, so narrow types like float32 are
+        compared without upcasting; other columns are converted to float64.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Numeric data, missing values become NaN.
+
+        Returns
+        -------
+        List[Tuple[list, numpy.ndarray]]
+            Positions of the columns of each block, and a 2D array with their
+            values, not to be changed in place.
+        """
+
+        blocks = {}
+        for position, dtype in enumerate(df.dtypes):
+            if not (isinstance(dtype, np.dtype) and dtype.kind in "fiu"):
+                dtype = None
+            blocks.setdefault(dtype, []).append(position)
+
+        # Data with a single dtype is taken as a whole, without selecting
+        if len(blocks) == 1:
+            dtype, positions = blocks.popitem()
+            if dtype is None:
+                return [(positions, df.to_numpy(dtype=float, na_value=np.nan))]
+            return [(positions, df.to_numpy())]
+
+        arrays = []
+        for dtype, positions in blocks.items():
+            block = df.iloc[:, positions]
+            if dtype is None:
+                arrays.append((positions, block.to_numpy(dtype=float, na_value=np.nan)))
+            else:
+                arrays.append((positions, block.to_numpy()))
+        return arrays
+
+    @staticmethod
+    def _reduce(df, key, reduce, reductions=None):
+        """
+        Reduces the data, reusing an earlier result for the same key.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Data to reduce.
+        key : tuple
+            Identifies the reduction and its parameters.
+        reduce : Callable
+            Function computing the reduction from the DataFrame.
+        reductions : Optional[dict]
+            Reductions of the same data by key, reused and extended.
+
+        Returns
+        -------
+        object
+            Result of the reduction.
+        """
+
+        if reductions is None:
+            return reduce(df)
+        if key not in reductions:
+            reductions[key] = reduce(df)
+        return reductions[key]
+
+    @staticmethod
+    def _cast(target, dtype):
+        """
+        Casts the target to the provided dtype.
+
+        Parameters
+        ----------
+        target : Union[str, float, pandas.Series]
+            Target value, or Series to compare row by row.
+        dtype : numpy.dtype
+            Data type to cast to.
+
+        Returns
+        -------
+        Union[object, pandas.Series]
+            Cast target value or Series.
+        """
+
+        if isinstance(target, pd.Series):
+            return target.astype(dtype)
+        return pd.Series([target]).astype(dtype).iloc[0]
+
+    def check(self, df):
+        """
+        Checks whether all columns match the data type of the Comparator,
+        raising a TypeError otherwise.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Data to compare, only its dtypes are checked.
+        """
+
+        if self.dtype is not None:
+            self._check_dtypes(df, self.dtype)
 
     @staticmethod
     def _check_dtypes(df, dtype):
@@ -46,6 +282,25 @@ class Comparator:
 class Operator:
     """Abstract factory class for initializing Operator objects."""
 
+    # Operator subclasses by symbol, filled on class creation
+    _registry = {}
+
+    # Shared, stateless Operator instances by symbol
+    _instances = {}
+
+    # NumPy function combining the columns of the data per row, such as
+    # np.nanmean, called with the values and axis=1. Defined by the Operator
+    # subclasses.
+    function: Callable
+
+    def __init_subclass__(cls, **kwargs):
+        """Registers an Operator subclass defining its own symbol."""
+
+        super().__init_subclass__(**kwargs)
+        if "symbol" in cls.__dict__:
+            Operator._registry[cls.symbol] = cls
+            Operator._instances.pop(cls.symbol, None)
+
     @classmethod
     def get(cls, symbol):
         """
@@ -59,42 +314,106 @@ class Operator:
         Returns
         -------
         Operator
-            Instance of the requested Operator subclass.
+            Shared instance of the requested Operator subclass.
         """
 
-        symbols = {
-            op.symbol: op for op in cls.get_subclasses() if hasattr(op, "symbol")
-        }
-        if symbol not in symbols:
+        operator = cls._registry.get(symbol)
+        if operator is None or not issubclass(operator, cls):
             raise TypeError(f"Unknown Operator: {symbol}.")
 
-        return symbols[symbol]()
+        if symbol not in cls._instances:
+            cls._instances[symbol] = operator()
+        return cls._instances[symbol]
 
     @classmethod
     def list(cls):
         """
-        Returns a set of available Comparator symbols.
+        Returns a set of available Operator symbols.
 
         Returns
         -------
         set
-            Set of available Comparator symbols
+            Set of available Operator symbols
         """
 
-        return {op.symbol for op in cls.get_subclasses() if hasattr(op, "symbol")}
+        return {op.symbol for op in cls.get_subclasses()}
 
     @classmethod
     def get_subclasses(cls):
-        """Returns all subclasses recursively."""
+        """Returns all registered subclasses, taken from the registry."""
 
-        for subclass in cls.__subclasses__():
-            yield from subclass.get_subclasses()
-            yield subclass
+        return [op for op in cls._registry.values() if issubclass(op, cls)]
 
 
 class DataOperator(Operator):
     """Base class for data operators."""
 
+    # Result for rows with only missing values, which are not reduced
+    empty_value = np.nan
+
+    def __call__(self, df):
+        self.check(df)
+        values = df.to_numpy(dtype=float, na_value=np.nan)
+        return pd.DataFrame(self.reduce(values), index=df.index)
+
+    @staticmethod
+    def check(df):
+        """
+        Checks whether all columns are numeric (or boolean), raising a
+        TypeError otherwise.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Data to reduce, only its dtypes are checked.
+        """
+
+        invalid = [
+            str(col)
+            for col, dtype in df.dtypes.items()
+            if not pd.api.types.is_numeric_dtype(dtype)
+        ]
+        if invalid:
+            raise TypeError(
+                f"Columns did not match dtype 'number': {', '.join(invalid)}."
+            )
+
+    def reduce(self, values):
+        """
+        Reduces a 2D array of numeric values to a 1D array, row by row.
+
+        Parameters
+        ----------
+        values : numpy.ndarray
+            2D float array, missing values should be NaN.
+
+        Returns
+        -------
+        numpy.ndarray
+            1D array with one aggregated value per row.
+        """
+
+        # Rows with only missing values are skipped, NumPy would warn about
+        # them. Changing the warning filters instead is not thread-safe.
+        valid = ~np.isnan(values).all(axis=1)
+        if valid.all():
+            return self.function(values, axis=1)
+
+        result = np.full(len(values), self.empty_value, dtype=float)
+        result[valid] = self.function(values[valid], axis=1)
+        return result
+
 
 class LogicalOperator(Operator):
     """Base class for logical operators."""
+
+    # Value used for missing data, matching pandas' skipna behaviour
+    fill_value = False
+
+    # NumPy ufunc combining results for separate blocks of columns into the
+    # result for all columns, None if they cannot be combined
+    combine = None
+
+    def __call__(self, df):
+        values = df.to_numpy(dtype=bool, na_value=self.fill_value)
+        return pd.DataFrame(self.function(values, axis=1), index=df.index)
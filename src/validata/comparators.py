@@ -12,6 +12,8 @@ Comparator classes should always extend the `Comparators` base class and
 be initialized via the `Comparators.get()` method.
 """
 import re
+
+import numpy as np
 import pandas as pd
 
 from validata.base_classes import Comparator
@@ -21,109 +23,173 @@ class EqComparator(Comparator):
     """Checks for identical values."""
 
     symbol = "=="
+    ufunc = np.equal
 
     def __call__(self, df, target):
-        res = pd.DataFrame()
-
         if not isinstance(target, pd.Series):
-            target = pd.Series(target, index=df.index)
+            return self._apply_ufunc_numeric(df, target, self._eq_scalar)
+
+        # Cast the target once per dtype instead of once per column
+        casts = {}
+        res = {}
+        for col, dtype in df.dtypes.items():
+            if dtype not in casts:
+                casts[dtype] = self._cast(target, dtype)
+            res[col] = df[col] == casts[dtype]
+
+        return pd.DataFrame(res, index=df.index)
+
+    def _eq_scalar(self, df, target):
+        """
+        Compares non-numeric data to a scalar target, choosing how to compare
+        per dtype: string data at once on the data array, categoricals on
+        their integer codes, and other data by casting the target.
+        """
+
+        blocks = {}
+        for col, dtype in df.dtypes.items():
+            blocks.setdefault(dtype, []).append(col)
+
+        res = {}
+        for dtype, cols in blocks.items():
+            if dtype == object or isinstance(dtype, pd.StringDtype):
+                block = df if len(blocks) == 1 else df[cols]
+                values = block.to_numpy(dtype=object, na_value=None)
+                res.update(zip(cols, np.equal(values, target).astype(bool).T))
+
+            elif isinstance(dtype, pd.CategoricalDtype):
+                for col in cols:
+                    res[col] = self._eq_categorical(df[col], target)
+
+            else:
+                cast = self._cast(target, dtype)
+                for col in cols:
+                    res[col] = df[col] == cast
+
+        return pd.DataFrame({col: res[col] for col in df.columns}, index=df.index)
 
-        for col in df.columns:
-            res[col] = df[col] == target.astype(df[col].dtype)
+    @staticmethod
+    def _eq_categorical(series, value):
+        """Compares a categorical Series on its integer codes."""
 
-        return res
+        code = series.cat.categories.get_indexer([value])[0]
+        if code == -1:
+            return pd.Series(False, index=series.index)
+        return series.cat.codes == code
 
 
 class UnEqComparator(Comparator):
     """Checks for non-identical values."""
 
     symbol = "!="
+    ufunc = np.not_equal
 
     def __call__(self, df, target):
-        eq_comp = EqComparator()
-        return ~eq_comp(df, target)
+        eq_comp = Comparator.get("==")
+        if isinstance(target, pd.Series):
+            return ~eq_comp(df, target)
+
+        return self._apply_ufunc_numeric(
+            df, target, lambda data, value: ~eq_comp(data, value)
+        )
 
 
 class GtComparator(Comparator):
     """Checks whether the data is greater than the target."""
 
     symbol = ">"
+    dtype = "number"
+    ufunc = np.greater
 
     def __call__(self, df, target):
-        self._check_dtypes(df, "number")
-
-        if not isinstance(target, pd.Series):
-            target = pd.Series(target, index=df.index)
-
-        return df.gt(target.astype(float), axis=0)
+        self.check(df)
+        return self._apply_ufunc(df, target)
 
 
 class GtEqComparator(Comparator):
     """Checks whether the data is greater than or equal to the target."""
 
     symbol = ">="
+    dtype = "number"
+    ufunc = np.greater_equal
 
     def __call__(self, df, target):
-        self._check_dtypes(df, "number")
-
-        if not isinstance(target, pd.Series):
-            target = pd.Series(target, index=df.index)
-
-        return df.ge(target.astype(float), axis=0)
+        self.check(df)
+        return self._apply_ufunc(df, target)
 
 
 class LtComparator(Comparator):
     """Checks whether the data is less than the target."""
 
     symbol = "<"
+    dtype = "number"
+    ufunc = np.less
 
     def __call__(self, df, target):
-        self._check_dtypes(df, "number")
-
-        if not isinstance(target, pd.Series):
-            target = pd.Series(target, index=df.index)
-
-        return df.lt(target.astype(float), axis=0)
+        self.check(df)
+        return self._apply_ufunc(df, target)
 
 
 class LtEqComparator(Comparator):
     """Checks whether the data is less than or equal to the target."""
 
     symbol = "<="
+    dtype = "number"
+    ufunc = np.less_equal
 
     def __call__(self, df, target):
-        self._check_dtypes(df, "number")
-
-        if not isinstance(target, pd.Series):
-            target = pd.Series(target, index=df.index)
-
-        return df.le(target.astype(float), axis=0)
+        self.check(df)
+        return self._apply_ufunc(df, target)
 
 
 class InComparator(Comparator):
     """Checks whether the data are present in the target list."""
 
     symbol = "in"
+    cost = 3
 
     def __call__(self, df, target):
         try:
-            target = [t.strip() for t in target.split(",")]
+            target = {t.strip() for t in target.split(",")}
         except AttributeError:
             raise RuntimeError(
                 f"InComparator: Cannot construct list from target '{target}'."
             )
 
-        # Comparing as string
-        return df.astype(str).isin(target)
+        # Comparing as string, only the unique values of each column are cast
+        return pd.DataFrame(
+            {col: self._isin(df[col], target) for col in df.columns},
+            index=df.index,
+        )
+
+    @staticmethod
+    def _isin(series, target):
+        """
+        Checks a Series for membership as string, casting only the unique
+        values (or categories) to string and looking up the integer codes.
+        """
+
+        if isinstance(series.dtype, pd.StringDtype):
+            return series.isin(target).astype(bool)
+
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            codes, uniques = series.cat.codes.to_numpy(), series.cat.categories
+        else:
+            codes, uniques = pd.factorize(series)
+
+        # Missing values have code -1, which picks the trailing False
+        found = np.append(uniques.astype(str).isin(target), False)
+        return pd.Series(found[codes], index=series.index)
 
 
 class BetweenComparator(Comparator):
     """Checks whether the data falls in the target range."""
 
     symbol = "between"
+    dtype = "number"
 
     def __call__(self, df, target):
-        self._check_dtypes(df, "number")
+        self.check(df)
 
         try:
             low, high = (float(t) for t in target.split(":"))
@@ -136,13 +202,25 @@ class BetweenComparator(Comparator):
                 f"BetweenComparator: Non-numeric bounds in target '{target}'."
             )
 
-        return df.applymap(lambda x: low <= float(x) <= high)
+        # Single range check on the raw array, missing values yield False.
+        return self._compare_numeric(
+            df, lambda _, values: self._between(values, low, high)
+        )
+
+    @staticmethod
+    def _between(values, low, high):
+        """Checks whether values fall in the range, including the bounds."""
+
+        result = values >= low
+        np.logical_and(result, values <= high, out=result)
+        return result
 
 
 class NullComparator(Comparator):
     """Checks whether the data is missing (no target required)."""
 
     symbol = "missing"
+    cost = 1
 
     def __call__(self, df, target=None):
         return df.isna()
@@ -152,18 +230,23 @@ class NotNullComparator(Comparator):
     """Checks whether the data is not missing (no target required)."""
 
     symbol = "not missing"
+    cost = 1
 
     def __call__(self, df, target=None):
-        return ~df.isna()
+        return df.notna()
 
 
 class RankComparator(Comparator):
     """Ranks records and indicates whether they fall above or below a threshold."""
 
     symbol = "ranks in"
+    dtype = "number"
+    cost = 5
+    rowwise = False
+    reduces = True
 
-    def __call__(self, df, target):
-        self._check_dtypes(df, "number")
+    def __call__(self, df, target, reductions=None):
+        self.check(df)
 
         match = re.match(
             r"(?P<from>top|bottom)\s+(?P<rank>[0-9]+)\s*(?P<pct>%)?", target
@@ -185,7 +268,12 @@ class RankComparator(Comparator):
                 )
             rank = rank / 100
 
-        ranks = df.rank(ascending=ascending, pct=pct)
+        ranks = self._reduce(
+            df,
+            ("rank", ascending, pct),
+            lambda data: data.rank(ascending=ascending, pct=pct),
+            reductions,
+        )
         return ranks <= rank
 
 
@@ -195,12 +283,20 @@ class ContainsComparator(Comparator):
     """
 
     symbol = "contains"
+    dtype = "object"
+    cost = 4
 
     def __call__(self, df, target):
-        self._check_dtypes(df, "object")
+        self.check(df)
 
         # Apply target as regex, mark missing values (ex. wrong data type) as False.
-        return df.apply(lambda col: col.str.contains(target, regex=True, na=False))
+        return pd.DataFrame(
+            {
+                col: df[col].str.contains(target, regex=True, na=False).astype(bool)
+                for col in df.columns
+            },
+            index=df.index,
+        )
 
 
 class OutlierComparator(Comparator):
@@ -216,51 +312,85 @@ class OutlierComparator(Comparator):
     """
 
     symbol = "is outlier by"
+    cost = 5
+    rowwise = False
+    reduces = True
+
+    @classmethod
+    def _outside(cls, df, lim_low, lim_high):
+        """
+        Marks values on or outside the limits per column in a single pass over
+        the data array of each dtype, skipping the check for a missing (None)
+        limit.
+        """
+
+        if lim_low is not None:
+            lim_low = np.asarray(lim_low, dtype=float)
+        if lim_high is not None:
+            lim_high = np.asarray(lim_high, dtype=float)
+
+        def compare(positions, values):
+            result = np.zeros(values.shape, dtype=bool)
+            if lim_low is not None:
+                np.less_equal(values, lim_low[positions], out=result)
+            if lim_high is not None:
+                result |= values >= lim_high[positions]
+            return result
+
+        return cls._compare_numeric(df, compare)
 
     @staticmethod
-    def _outlier_iqr(series, whisker_low=1.5, whisker_high=1.5):
+    def _median_mad(df):
+        """Computes the median and scaled Median Absolute Deviation."""
+
+        median = df.median()
+        return median, 1.483 * df.sub(median).abs().median()
+
+    @classmethod
+    def _outlier_iqr(cls, df, whisker_low=1.5, whisker_high=1.5, reductions=None):
         """Marks outliers using the Inter-Quartile Range method."""
 
-        # Calculate Q1, Q2 and IQR
-        qlow = series.quantile(0.25)
-        qhigh = series.quantile(0.75)
+        # Calculate Q1, Q3 and IQR for all columns at once
+        quantiles = cls._reduce(
+            df, ("quantiles",), lambda data: data.quantile([0.25, 0.75]), reductions
+        )
+        qlow = quantiles.iloc[0]
+        qhigh = quantiles.iloc[1]
         iqr = qhigh - qlow
 
         # Compute filter using IQR with optional whiskers
-        lim_low = -float("inf") if whisker_low is None else qlow - whisker_low * iqr
-        lim_high = float("inf") if whisker_high is None else qhigh + whisker_high * iqr
+        lim_low = None if whisker_low is None else qlow - whisker_low * iqr
+        lim_high = None if whisker_high is None else qhigh + whisker_high * iqr
 
-        return (series <= lim_low) | (series >= lim_high)
+        return cls._outside(df, lim_low, lim_high)
 
-    @staticmethod
-    def _outlier_sd(series, whisker_low=2, whisker_high=2):
+    @classmethod
+    def _outlier_sd(cls, df, whisker_low=2, whisker_high=2, reductions=None):
         """Marks outliers using mean and SD."""
 
-        mean = series.mean()
-        std = series.std()
+        mean, std = cls._reduce(
+            df, ("mean_sd",), lambda data: (data.mean(), data.std()), reductions
+        )
 
         # Compute filter using mean and SD with optional whiskers
-        lim_low = -float("inf") if whisker_low is None else mean - whisker_low * std
-        lim_high = float("inf") if whisker_high is None else mean + whisker_high * std
+        lim_low = None if whisker_low is None else mean - whisker_low * std
+        lim_high = None if whisker_high is None else mean + whisker_high * std
 
-        return (series <= lim_low) | (series >= lim_high)
+        return cls._outside(df, lim_low, lim_high)
 
-    @staticmethod
-    def _outlier_mad(series, whisker_low=2, whisker_high=2):
+    @classmethod
+    def _outlier_mad(cls, df, whisker_low=2, whisker_high=2, reductions=None):
         """Marks outliers using Median Absolute Deviation."""
 
-        median = series.median()
-        made = 1.483 * (series - median).abs().median()
+        median, made = cls._reduce(df, ("median_mad",), cls._median_mad, reductions)
 
         # Compute filter using MAD and optional whiskers
-        lim_low = -float("inf") if whisker_low is None else median - whisker_low * made
-        lim_high = (
-            float("inf") if whisker_high is None else median + whisker_high * made
-        )
+        lim_low = None if whisker_low is None else median - whisker_low * made
+        lim_high = None if whisker_high is None else median + whisker_high * made
 
-        return (series <= lim_low) | (series >= lim_high)
+        return cls._outside(df, lim_low, lim_high)
 
-    def __call__(self, df, target="1.5 IQR"):
+    def __call__(self, df, target="1.5 IQR", reductions=None):
         match = re.match(
             r"(?P<side>\+|\-)?\s*(?P<whiskers>[0-9\.]+)\s+(?P<method>IQR|SD|MAD)",
             target,
@@ -279,15 +409,17 @@ class OutlierComparator(Comparator):
         elif match.group("side") == "-":
             whisker_high = None
 
-        # Select method
-
-        if match.group("method").lower() == "sd":
-            method = self._outlier_sd
-        elif match.group("method").lower() == "mad":
-            method = self._outlier_mad
-        else:
-            method = self._outlier_iqr
-
-        return df.apply(
-            method, whisker_low=whisker_low, whisker_high=whisker_high, axis=0
+        # Select method, computing the limits for all columns at once
+        methods = {
+            "iqr": self._outlier_iqr,
+            "sd": self._outlier_sd,
+            "mad": self._outlier_mad,
+        }
+        method = methods[match.group("method").lower()]
+
+        return method(
+            df,
+            whisker_low=whisker_low,
+            whisker_high=whisker_high,
+            reductions=reductions,
         )
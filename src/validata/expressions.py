@@ -0,0 +1,150 @@
+"""Module containing the expression nodes the Parser class evaluates."""
+
+from validata.comparators import Comparator
+from validata.operators import Operator
+
+
+class PartialExpression:
+    """
+    Node for a partial expression, for example "any income_* > 50000".
+
+    Parameters
+    ----------
+    operator : Optional[str]
+        String identifying an Operator class.
+    columns : list
+        List of column tokens.
+    comparator : str
+        String identifying a Comparator class.
+    target : Union[str, tuple]
+        Target value to compare data against, or tuple of target values for
+        folded equality checks.
+    """
+
+    def __init__(self, operator, columns, comparator, target):
+        self.operator = operator
+        self.columns = columns
+        self.comparator = comparator
+        self.target = target
+
+        # Comparator and Operator objects, resolved once if the symbols are
+        # known. Unknown symbols raise when evaluating.
+        self.comparator_object = None
+        if comparator in Comparator.list():
+            self.comparator_object = Comparator.get(comparator)
+        self.operator_object = None
+        if operator in Operator.list():
+            self.operator_object = Operator.get(operator)
+
+        # Columns of the data and the column names selected from them,
+        # resolved once per data schema
+        self.selection = None, None
+
+    @property
+    def cost(self):
+        """Estimated evaluation cost from the comparator and number of columns."""
+
+        cost = 2
+        if self.comparator_object is not None:
+            cost = self.comparator_object.cost
+        return (cost + bool(self.operator)) * max(len(self.columns), 1)
+
+    def select_columns(self, df):
+        """
+        Selects the columns of the partial expression, reusing the selection
+        while the columns of the data stay the same.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Data set to select the columns from.
+
+        Returns
+        -------
+        list
+            Unique selected column names, in the order of the DataFrame.
+        """
+
+        # Index objects are immutable, the same object has the same columns.
+        # The selection is replaced as a whole, parsers may be shared between
+        # threads validating data with different columns.
+        schema, selected = self.selection
+        if schema is not df.columns and not df.columns.equals(schema):
+            selected = self._select_columns(df, self.columns)
+            self.selection = df.columns, selected
+        return selected
+
+    @staticmethod
+    def _select_columns(df, column_tokens):
+        """
+        Select columns from a DataFrame based on al list of column tokens.
+
+        Returns
+        -------
+        list
+            Unique selected column names, in the order of the DataFrame.
+        """
+
+        selected = []
+        for token in column_tokens:
+
+            # Match by regular expression
+            if token.type == "REGEX":
+                cols = df.columns[df.columns.str.contains(token.value, regex=True)]
+                selected.extend(cols)
+
+            # Match by name
+            else:
+                col_name = token.value
+                if col_name.endswith("*"):
+                    cols = df.columns[df.columns.str.startswith(col_name[:-1])]
+                    if cols.empty:
+                        raise RuntimeError(
+                            f"No columns were selected using expression: '{col_name}'."
+                        )
+                    selected.extend(cols)
+
+                else:
+                    if col_name not in df.columns:
+                        raise RuntimeError(
+                            f"Column '{col_name}' not found in the data."
+                        )
+                    selected.append(col_name)
+
+        # A single token selects unique columns in data order already
+        if len(column_tokens) == 1:
+            return list(selected)
+
+        # Return unique columns as list in data order; pandas does not
+        # accept sets as indexer.
+        return df.columns[df.columns.isin(selected)].tolist()
+
+    def __repr__(self):
+        return (
+            f"PartialExpression({self.operator}, {self.columns}, "
+            f"{self.comparator}, {self.target})"
+        )
+
+
+class LogicalExpression:
+    """
+    Node combining two expressions using and / or.
+
+    Parameters
+    ----------
+    logic : str
+        Token type of the combination, either "AND" or "OR".
+    left : Union[PartialExpression, LogicalExpression]
+        Left hand side expression.
+    right : Union[PartialExpression, LogicalExpression]
+        Right hand side expression.
+    """
+
+    def __init__(self, logic, left, right):
+        self.logic = logic
+        self.left = left
+        self.right = right
+        self.cost = left.cost + right.cost
+
+    def __repr__(self):
+        return f"LogicalExpression({self.logic}, {self.left}, {self.right})"
@@ -8,7 +8,8 @@ with just a single column.
 
 Operator classes should extend either the DataOperator or LogicalOperator
 base class. DataOperator classes operate on the raw data values; for example,
-they could compute the sum or the minimum value from a set of columns.
+they could compute the sum or the minimum value from a set of columns. The
+data values should be numeric or boolean, other columns raise a TypeError.
 
 LogicalOperators operate on the boolean values returned by a Comparator. A
 Comparator can return multiple columns with boolean values. A LogicalOperator
@@ -18,6 +19,8 @@ values are True.
 All Operator classes should be initialized using the `Operator.get()` method.
 """
 
+import numpy as np
+
 # pylint: disable=unused-import
 from validata.base_classes import Operator, DataOperator, LogicalOperator
 
@@ -26,69 +29,65 @@ class MeanOperator(DataOperator):
     """Computes the mean value across columns."""
 
     symbol = "mean"
-
-    def __call__(self, df):
-        return df.mean(axis=1).to_frame()
+    function = staticmethod(np.nanmean)
 
 
 class MedianOperator(DataOperator):
     """Computes the median value across columns."""
 
     symbol = "median"
-
-    def __call__(self, df):
-        return df.median(axis=1).to_frame()
+    function = staticmethod(np.nanmedian)
 
 
 class MinOperator(DataOperator):
     """Computes the minumum value across columns."""
 
     symbol = "min"
-
-    def __call__(self, df):
-        return df.min(axis=1).to_frame()
+    function = staticmethod(np.nanmin)
 
 
 class MaxOperator(DataOperator):
     """Computes the maximum value across columns."""
 
     symbol = "max"
-
-    def __call__(self, df):
-        return df.max(axis=1).to_frame()
+    function = staticmethod(np.nanmax)
 
 
 class SumOperator(DataOperator):
     """Computes the sum across columns."""
 
     symbol = "sum"
-
-    def __call__(self, df):
-        return df.sum(axis=1).to_frame()
+    function = staticmethod(np.nansum)
+    empty_value = 0.0
 
 
 class AnyOperator(LogicalOperator):
     """Returns True if any column contains True, False otherwise."""
 
     symbol = "any"
-
-    def __call__(self, df):
-        return df.any(axis=1).to_frame()
+    function = staticmethod(np.any)
+    combine = np.logical_or
 
 
 class AllOperator(LogicalOperator):
     """Returns True if all columns contain True, False otherwise."""
 
     symbol = "all"
-
-    def __call__(self, df):
-        return df.all(axis=1).to_frame()
+    function = staticmethod(np.all)
+    fill_value = True
+    combine = np.logical_and
 
 
 class NoneOperator(LogicalOperator):
     """Returns True if all column contain False, True otherwise."""
 
     symbol = "none"
+    combine = np.logical_and
+
+    @staticmethod
+    def function(values, axis):
+        """Returns True where no values along the axis are True."""
 
-    def __call__(self, df):
-        return ~df.any(axis=1).to_frame()
+        # Negate in place, avoiding a second result array
+        result = np.any(values, axis=axis)
+        return np.logical_not(result, out=result)
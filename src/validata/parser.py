@@ -2,9 +2,11 @@
 
 import logging
 import numpy as np
+import pandas as pd
 
 from validata.tokenizer import Tokenizer
 from validata.comparators import Comparator
+from validata.expressions import PartialExpression, LogicalExpression
 from validata.operators import Operator, LogicalOperator, DataOperator
 
 
@@ -12,6 +14,9 @@ class Parser:
     """
     Parses for complex, nested boolean expressions.
 
+    The expression is parsed into a tree of expression nodes once, which
+    is then evaluated against each provided data set.
+
     Parameters
     ----------
     expression : str
@@ -23,112 +28,552 @@ class Parser:
         Name for the validation, defaults to "validation_result".
     """
 
+    # Largest share of undecided rows for which the right hand side of an
+    # and / or node is evaluated on those rows only
+    _max_undecided = 0.5
+
+    # Token types combining expressions
+    _logic = frozenset(("AND", "OR"))
+
+    # Token types ending a partial expression
+    _end_partial = frozenset(("AND", "OR", "GROUP_OPEN", "GROUP_CLOSE"))
+
+    # Number of columns compared at once when reducing many columns using a
+    # LogicalOperator, bounding the memory used for intermediate results
+    _column_block = 64
+
+    # Comparators that can be folded into a single comparison to several
+    # targets, by the and / or combining them
+    _foldable = {"OR": "==", "AND": "!="}
+
     def __init__(self, expression, name="validation_result"):
         self._log = logging.getLogger(__name__)
 
         # TO DO: Check for duplicate names
         token_types = {op: "OPERATOR" for op in Operator.list()}
         token_types.update({comp: "COMPARATOR" for comp in Comparator.list()})
-        self._tokenizer = Tokenizer(expression, token_types)
+
+        # Parse using a cursor over the tokens of the expression
+        self._cursor = iter(Tokenizer(expression, token_types))
+
+        self._tree = self._parse()
+        if self._tree is None:
+            raise ValueError(f"No expression found in: '{expression}'.")
 
         self._name = name
 
-    def evaluate(self, df):
+    def _parse(self):
         """
-        Evaluate the logical expression against the provided pandas DataFrame.
-
-        Parameters
-        ----------
-        df : pandas.DataFrame
-            Data set to evaluate the expression against.
+        Parses tokens up to the end of the current (nested) expression.
 
         Returns
         -------
-        pandas.DataFrame
-            Single-column DataFrame with validation results.
+        Union[PartialExpression, LogicalExpression]
+            Root node of the parsed expression, None if there are no tokens.
         """
 
-        result = None
-
-        for token in self._tokenizer:
-
-            self._log.debug("Processing token: %s [%s]", token.value, token.type)
+        node = None
+        for token in self._cursor:
 
             # Handle grouping / nesting
             if token.type == "GROUP_OPEN":
-                self._log.debug("Entering nested expression.")
-                result = self.evaluate(df)
+                if node is not None:
+                    raise ValueError("Expected and / or, got expression instead.")
+                node = self._parse_group()
 
             elif token.type == "GROUP_CLOSE":
-                self._log.debug("Exiting nested expression.")
                 break
 
-            elif token.type in ["AND", "OR"]:
-                self._log.debug("Processing %s expression.", token.value)
-
-                if result is None:
+            elif token.type in self._logic:
+                if node is None:
                     raise ValueError(
                         "Use of and / or without left hand side expression."
                     )
 
-                # Get right hand side, compute results
-                next_token = next(self._tokenizer)
-                if next_token.type == "GROUP_OPEN":
-                    self._log.debug("Entering nested right-hand expression.")
-                    right_hand = self.evaluate(df)
+                right_hand = self._parse_right()
 
+                # Fold equality checks of the same columns, otherwise evaluate
+                # the cheapest side first, it may decide all rows
+                folded = self._fold(token.type, node, right_hand)
+                if folded is not None:
+                    node = folded
                 else:
-                    self._log.debug("Evaluating right-hand partial expression.")
-
-                    # Collect and evaluate the partial expression
-                    self._tokenizer.rewind()
-                    op, cols, comp, val = self._collect_partial()
-                    self._log.debug(
-                        "Operator: %s, Columns: %s, Comparator: %s, Value: %s",
-                        op,
-                        cols,
-                        comp,
-                        val,
+                    node = LogicalExpression(
+                        token.type, *sorted((node, right_hand), key=lambda n: n.cost)
                     )
-                    right_hand = self._evaluate_partial(df, cols, comp, val, op)
 
-                # Apply and / or operation
-                if token.type == "AND":
-                    # result = result and right_hand
-                    result = np.all(
-                        result.join(right_hand, rsuffix="_rh"), axis=1
-                    ).to_frame()
+            else:
+                if node is not None:
+                    raise ValueError("Expected and / or, got expression instead.")
 
-                else:
-                    # result = result or right_hand
-                    result = np.any(
-                        result.join(right_hand, rsuffix="_rh"), axis=1
-                    ).to_frame()
+                node = PartialExpression(*self._collect_partial(token))
+
+        return node
+
+    def _parse_right(self):
+        """
+        Parses the right hand side expression of an and / or.
+
+        Returns
+        -------
+        Union[PartialExpression, LogicalExpression]
+            Root node of the right hand side expression.
+        """
+
+        next_token = next(self._cursor, None)
+        if next_token is None:
+            raise ValueError("Use of and / or without right hand side expression.")
+
+        if next_token.type == "GROUP_OPEN":
+            return self._parse_group()
+        return PartialExpression(*self._collect_partial(next_token))
+
+    def _parse_group(self):
+        """
+        Parses tokens up to the end of the current group.
+
+        Returns
+        -------
+        Union[PartialExpression, LogicalExpression]
+            Root node of the parsed group.
+
+        Raises
+        ------
+        ValueError
+            If the group does not contain an expression.
+        """
+
+        node = self._parse()
+        if node is None:
+            raise ValueError("Use of parentheses without expression.")
+
+        return node
+
+    def _fold(self, logic, left, right):
+        """
+        Folds equality checks of the same columns combined using or, for
+        example "size == 1 or size == 2", into a single partial expression
+        comparing to a tuple of targets. Inequality checks combined using and
+        are folded likewise.
+
+        Parameters
+        ----------
+        logic : str
+            Token type of the combination, either "AND" or "OR".
+        left : Union[PartialExpression, LogicalExpression]
+            Left hand side expression.
+        right : Union[PartialExpression, LogicalExpression]
+            Right hand side expression.
 
+        Returns
+        -------
+        Optional[PartialExpression]
+            Folded partial expression, None if the expressions cannot be folded.
+        """
+
+        comparator = self._foldable[logic]
+        for node in (left, right):
+            if (
+                not isinstance(node, PartialExpression)
+                or node.operator
+                or node.comparator != comparator
+                or (isinstance(node.target, str) and node.target.startswith("{"))
+            ):
+                return None
+
+        if [(t.value, t.type) for t in left.columns] != [
+            (t.value, t.type) for t in right.columns
+        ]:
+            return None
+
+        targets = tuple(
+            target
+            for node in (left, right)
+            for target in (
+                node.target if isinstance(node.target, tuple) else (node.target,)
+            )
+        )
+        return PartialExpression(None, left.columns, comparator, targets)
+
+    def _partials(self, node=None):
+        """
+        Yields all partial expressions below a node (default the root of the
+        tree), from left to right.
+        """
+
+        pending = [self._tree if node is None else node]
+        while pending:
+            node = pending.pop()
+            if isinstance(node, PartialExpression):
+                yield node
             else:
-                self._log.debug("Evaluating partial expression.")
+                pending.append(node.right)
+                pending.append(node.left)
 
-                if result is not None:
-                    raise ValueError("Expected and / or, got expression instead.")
+    @property
+    def rowwise(self):
+        """
+        Whether the results per row depend on that row only, so the expression
+        can be evaluated on a subset of the rows.
+        """
+
+        return all(
+            partial.comparator_object is not None and partial.comparator_object.rowwise
+            for partial in self._partials()
+        )
+
+    def comparisons(self, df):
+        """
+        Lists the comparisons in the expression that can be shared with
+        other expressions, i.e. those without a DataOperator or target column.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Data set to select the compared columns from.
+
+        Returns
+        -------
+        List[Tuple[str, str, list]]
+            List of comparator, target value and selected columns.
+        """
 
-                # Collect and evaluate the partial expression
-                self._tokenizer.rewind()
-                op, cols, comp, val = self._collect_partial()
-                self._log.debug(
-                    "Operator: %s, Columns: %s, Comparator: %s, Value: %s",
-                    op,
-                    cols,
-                    comp,
-                    val,
+        comparisons = []
+        for partial in self._partials():
+            if (
+                isinstance(partial.target, tuple) or partial.target.startswith("{")
+            ) or (
+                partial.operator
+                and isinstance(
+                    partial.operator_object or Operator.get(partial.operator),
+                    DataOperator,
                 )
-                result = self._evaluate_partial(df, cols, comp, val, op)
-        result.columns = [self._name]
-        return result
+            ):
+                continue
+            comparisons.append(
+                (
+                    partial.comparator,
+                    partial.target,
+                    partial.select_columns(df),
+                )
+            )
+
+        return comparisons
+
+    def check(self, df, node=None):
+        """
+        Checks whether the expression can be evaluated against the data,
+        raising the error evaluating it would raise. Checks whether the
+        columns and target columns exist, and whether the compared columns
+        match the data type of the comparator, or are numeric when they are
+        aggregated by a DataOperator.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Data set to evaluate the expression against.
+        node : Optional[Union[PartialExpression, LogicalExpression]]
+            Node to check the partial expressions of, defaults to the root of
+            the tree.
+        """
+
+        for partial in self._partials(node):
+            columns = self._check_columns(df, partial)
+
+            # Comparators compare the aggregate of a DataOperator instead
+            if isinstance(partial.operator_object, DataOperator):
+                partial.operator_object.check(df.iloc[:0][columns])
+            elif partial.comparator_object is not None:
+                partial.comparator_object.check(df.iloc[:0][columns])
+
+    def _check_columns(self, df, partial):
+        """
+        Selects the columns of a partial expression, checking whether they
+        and the target column exist.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Data set to select the columns from.
+        partial : PartialExpression
+            Partial expression node to check.
+
+        Returns
+        -------
+        list
+            Unique selected column names, in the order of the DataFrame.
+        """
+
+        columns = partial.select_columns(df)
+
+        target = partial.target
+        if (
+            isinstance(target, str)
+            and target.startswith("{")
+            and target.endswith("}")
+            and target[1:-1] not in df.columns
+        ):
+            raise RuntimeError(f"Target column '{target[1:-1]}' does not exist.")
+
+        return columns
+
+    def evaluate(self, df, cache=None):
+        """
+        Evaluate the logical expression against the provided pandas DataFrame.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Data set to evaluate the expression against.
+        cache : Optional[dict]
+            Comparison results by comparator, target value and column name,
+            and results of partial expressions, reused and extended while
+            evaluating.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Single-column DataFrame with validation results.
+        """
+
+        return pd.DataFrame(
+            {self._name: self.evaluate_values(df, cache)}, index=df.index
+        )
+
+    def evaluate_values(self, df, cache=None):
+        """
+        Evaluate the logical expression, returning the results as array.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Data set to evaluate the expression against.
+        cache : Optional[dict]
+            Comparison results by comparator, target value and column name,
+            and results of partial expressions, reused and extended while
+            evaluating.
+
+        Returns
+        -------
+        numpy.ndarray
+            1D array with validation results, boolean results have missing
+            values set to False.
+        """
+
+        # Check the columns of all partial expressions first, skipping the
+        # right hand side of an and / or node should not hide typos
+        for partial in self._partials():
+            self._check_columns(df, partial)
+
+        # Walk the tree without recursion, keeping results as arrays. Pending
+        # holds nodes to evaluate and and / or nodes awaiting a result.
+        # Identical partial expressions share their result through the memo,
+        # which is kept in the cache to share results with other expressions.
+        memo = {} if cache is None else cache
+        results = []
+        pending = [("EVALUATE", self._tree, None)]
+        while pending:
+            step, node, rows = pending.pop()
+
+            # Partial results may be shared through the cache or memo, so they
+            # are marked as not owned and never overwritten.
+            if step == "EVALUATE" and isinstance(node, PartialExpression):
+                if rows is None:
+                    key = self._partial_key(df, node)
+                    if key not in memo:
+                        memo[key] = self._partial_values(df, node, cache)
+                    results.append((memo[key], False))
+                else:
+                    results.append((self._partial_values(df, node, cache, rows), True))
+
+            elif step == "EVALUATE":
+                pending.append(("RIGHT", node, None))
+                pending.append(("EVALUATE", node.left, None))
+
+            # Skip the right hand side if the left hand side decides all rows
+            elif step == "RIGHT":
+                left_hand, _ = results[-1]
+                if not self._skip_right(df, node, left_hand):
+                    rows = self._undecided(df, node, left_hand, memo)
+                    pending.append(("COMBINE", node, None))
+                    pending.append(("EVALUATE", node.right, rows))
+
+            # Apply element-wise and / or operation
+            else:
+                right_hand = results.pop()
+                left_hand = results.pop()
+                results.append((self._combine(node.logic, left_hand, right_hand), True))
+
+        return results.pop()[0]
+
+    def _partial_key(self, df, node):
+        """Identifies a partial expression by its components and columns."""
+
+        return (
+            "partial",
+            node.operator,
+            tuple(node.select_columns(df)),
+            node.comparator,
+            node.target,
+        )
+
+    def _skip_right(self, df, node, left_hand):
+        """
+        Checks whether the left hand side of an and / or node decides all
+        rows, still checking the data types of the right hand side then.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Data set to evaluate the expression against.
+        node : LogicalExpression
+            Expression node to evaluate the right hand side of.
+        left_hand : numpy.ndarray
+            Left hand side boolean array.
+
+        Returns
+        -------
+        bool
+            Whether evaluating the right hand side can be skipped.
+        """
+
+        if node.logic == "AND" and not left_hand.any():
+            self._log.debug("Skipping right hand side, all rows are False.")
+        elif node.logic == "OR" and left_hand.all():
+            self._log.debug("Skipping right hand side, all rows are True.")
+        else:
+            return False
+
+        self.check(df, node.right)
+        return True
+
+    def _undecided(self, df, node, left_hand, cache=None):
+        """
+        Finds the rows for which the right hand side of an and / or node still
+        matters, if only few rows remain and the right hand side is a partial
+        expression that compares rows independently and is not cached yet.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Data set to evaluate the expression against.
+        node : LogicalExpression
+            Expression node to evaluate the right hand side of.
+        left_hand : numpy.ndarray
+            Left hand side boolean array.
+        cache : Optional[dict]
+            Comparison results by comparator, target value and column name,
+            and results of partial expressions.
+
+        Returns
+        -------
+        Optional[numpy.ndarray]
+            Positions of the undecided rows, None to evaluate all rows.
+        """
+
+        partial = node.right
+        if not isinstance(partial, PartialExpression) or (
+            partial.comparator_object is None or not partial.comparator_object.rowwise
+        ):
+            return None
+
+        if cache is not None and self._partial_key(df, partial) in cache:
+            return None
+
+        if cache and all(
+            (partial.comparator, partial.target, col) in cache
+            for col in partial.select_columns(df)
+        ):
+            return None
+
+        undecided = left_hand if node.logic == "AND" else ~left_hand
+        rows = np.flatnonzero(undecided)
+        if len(rows) > self._max_undecided * len(left_hand):
+            return None
+        return rows
+
+    @staticmethod
+    def _combine(logic, left_hand, right_hand):
+        """
+        Combines two boolean arrays using and / or, storing the result in an
+        array that is owned, instead of shared through the cache.
+
+        Parameters
+        ----------
+        logic : str
+            Token type of the combination, either "AND" or "OR".
+        left_hand : Tuple[numpy.ndarray, bool]
+            Left hand side boolean array, and whether it is owned.
+        right_hand : Tuple[numpy.ndarray, bool]
+            Right hand side boolean array, and whether it is owned.
+
+        Returns
+        -------
+        numpy.ndarray
+            Combined boolean array.
+        """
+
+        left_values, left_owned = left_hand
+        right_values, right_owned = right_hand
+        out = None
+        if left_owned:
+            out = left_values
+        elif right_owned:
+            out = right_values
+
+        if logic == "AND":
+            return np.logical_and(left_values, right_values, out=out)
+        return np.logical_or(left_values, right_values, out=out)
+
+    def _partial_values(self, df, node, cache=None, rows=None):
+        """
+        Evaluates a partial expression node against the provided pandas
+        DataFrame, returning the results as array.
+
+        Parameters
+        ----------
+        node : PartialExpression
+            Partial expression node to evaluate.
+        df : pandas.DataFrame
+            Data set to evaluate the expression against.
+        cache : Optional[dict]
+            Comparison results by comparator, target value and column name.
+        rows : Optional[numpy.ndarray]
+            Positions of the rows to evaluate, other rows are set to False.
+
+        Returns
+        -------
+        numpy.ndarray
+            1D array with validation results, boolean results have missing
+            values set to False.
+        """
+
+        if self._log.isEnabledFor(logging.DEBUG):
+            self._log.debug("Evaluating partial expression: %s", node)
+
+        result = self._evaluate_partial(df, node, cache, rows).iloc[:, 0]
+        if pd.api.types.is_bool_dtype(result.dtype):
+            result = result.to_numpy(dtype=bool, na_value=False)
+        else:
+            result = result.to_numpy()
+
+        if rows is None:
+            return result
+
+        values = np.zeros(len(df), dtype=result.dtype)
+        values[rows] = result
+        return values
 
-    def _collect_partial(self):
+    def _collect_partial(self, first_token):
         """
         Collect and classify the tokens of a partial expression.
 
+        Parameters
+        ----------
+        first_token : Token
+            First token of the partial expression, already taken from the
+            token cursor.
+
         Returns
         -------
         Tuple[str, list, str, str]
@@ -136,13 +581,11 @@ class Parser:
         """
 
         # Collect all tokens of the sub-expression
-        end_sub = "AND", "OR", "GROUP_OPEN", "GROUP_CLOSE"
-        tokens = []
-        for token in self._tokenizer:
-            tokens.append(token)
-            next_token = self._tokenizer.peek()
-            if next_token and next_token.type in end_sub:
-                break
+        tokens = [first_token]
+        next_token = self._cursor.peek()
+        while next_token is not None and next_token.type not in self._end_partial:
+            tokens.append(next(self._cursor))
+            next_token = self._cursor.peek()
 
         # Initialize categories
         operator = None
@@ -166,41 +609,222 @@ class Parser:
         return operator, columns, comparator, " ".join(value)
 
     @staticmethod
-    def _select_columns(df, column_tokens):
+    def _can_fuse(df, comparator):
+        """
+        Checks whether a DataOperator and Comparator can be applied in a
+        single NumPy pass; requires numeric data and a ufunc comparator.
+        """
+
+        return hasattr(comparator, "ufunc") and all(
+            pd.api.types.is_numeric_dtype(dtype) for dtype in df.dtypes
+        )
+
+    @staticmethod
+    def _fused_partial(df, operator, comparator, target, cache=None):
+        """
+        Aggregates and compares numeric data in a single NumPy pass, skipping
+        the intermediate DataFrames of piping operator and comparator. The
+        data array and aggregates are cached, so for example a min and max
+        check on the same columns convert the data only once.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Numeric data to aggregate and compare.
+        operator : DataOperator
+            DataOperator to aggregate the data with.
+        comparator : Comparator
+            Comparator providing a NumPy ufunc for the comparison.
+        target : Union[str, pandas.Series]
+            Target value or column to compare against.
+        cache : Optional[dict]
+            Comparison results, data arrays and aggregates by column names.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Single-column DataFrame with validation results.
+        """
+
+        if cache is None:
+            cache = {}
+
+        columns = tuple(df.columns)
+        if ("aggregate", operator.symbol, columns) not in cache:
+            if ("values", columns) not in cache:
+                cache["values", columns] = df.to_numpy(dtype=float, na_value=np.nan)
+            cache["aggregate", operator.symbol, columns] = operator.reduce(
+                cache["values", columns]
+            )
+
+        if isinstance(target, pd.Series):
+            target = target.to_numpy(dtype=float, na_value=np.nan)
+        else:
+            target = float(target)
+
+        aggregate = cache["aggregate", operator.symbol, columns]
+        return pd.DataFrame(comparator.ufunc(aggregate, target), index=df.index)
+
+    @staticmethod
+    def _compare(df, comparator, target, cache=None):
+        """
+        Applies a Comparator to all columns of a DataFrame, taking results for
+        columns that were compared before from the cache.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Data to compare.
+        comparator : Comparator
+            Comparator to apply.
+        target : Union[str, pandas.Series]
+            Target value or column to compare against, only results for
+            target values are cached.
+        cache : Optional[dict]
+            Comparison results by comparator, target value and column name.
+
+        Returns
+        -------
+        pandas.DataFrame
+            DataFrame with comparison results.
+        """
+
+        if cache is None or isinstance(target, pd.Series):
+            return comparator(df, target=target)
+
+        missing = [
+            col for col in df.columns if (comparator.symbol, target, col) not in cache
+        ]
+        if len(missing) == df.shape[1]:
+            compared = Parser._apply_comparator(df, comparator, target, cache)
+            for col in missing:
+                cache[comparator.symbol, target, col] = compared[col]
+            return compared
+
+        if missing:
+            compared = Parser._apply_comparator(df[missing], comparator, target, cache)
+            for col in missing:
+                cache[comparator.symbol, target, col] = compared[col]
+
+        return pd.DataFrame(
+            {col: cache[comparator.symbol, target, col] for col in df.columns},
+            index=df.index,
+        )
+
+    @staticmethod
+    def _apply_comparator(df, comparator, target, cache):
+        """
+        Applies a Comparator, passing reductions of the same columns made
+        earlier in this evaluation to Comparators reusing them, for example
+        ranks compared to another threshold.
         """
-        Select columns from a DataFrame based on al list of column tokens.
+
+        if not comparator.reduces:
+            return comparator(df, target=target)
+
+        reductions = cache.setdefault(("reductions", tuple(df.columns)), {})
+        return comparator(df, target=target, reductions=reductions)
+
+    def _compare_reduced(self, df, comparator, target, operator, cache=None):
         """
+        Applies a Comparator and reduces the results using a LogicalOperator.
+        Many columns are compared in blocks, combining the reduced results of
+        each block and stopping once all rows are decided.
 
-        selected = []
-        for token in column_tokens:
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Data to compare.
+        comparator : Comparator
+            Comparator to apply.
+        target : Union[str, pandas.Series]
+            Target value or column to compare against.
+        operator : LogicalOperator
+            LogicalOperator reducing the comparison results.
+        cache : Optional[dict]
+            Comparison results by comparator, target value and column name.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Single-column DataFrame with validation results.
+        """
 
-            # Match by regular expression
-            if token.type == "REGEX":
-                cols = df.columns[df.columns.str.contains(token.value, regex=True)]
-                selected.extend(cols)
+        # Comparators using statistics of the data are applied at once,
+        # these may be reused when the same data is compared again.
+        if (
+            operator.combine is None
+            or not comparator.rowwise
+            or df.shape[1] <= self._column_block
+        ):
+            return operator(self._compare(df, comparator, target, cache))
 
-            # Match by name
+        result = None
+        for start in range(0, df.shape[1], self._column_block):
+            block = df.iloc[:, start : start + self._column_block]
+            reduced = operator(self._compare(block, comparator, target, cache))
+            reduced = reduced.iloc[:, 0].to_numpy()
+            if result is None:
+                result = reduced.copy()
             else:
-                col_name = token.value
-                if col_name.endswith("*"):
-                    cols = {col for col in df.columns if col.startswith(col_name[:-1])}
-                    if not cols:
-                        raise RuntimeError(
-                            f"No columns were selected using expression: '{col_name}'."
-                        )
-                    selected.extend(cols)
+                operator.combine(result, reduced, out=result)
 
-                else:
-                    if col_name not in df.columns:
-                        raise RuntimeError(
-                            f"Column '{col_name}' not found in the data."
-                        )
-                    selected.append(col_name)
+            if result.all() if operator.combine is np.logical_or else not result.any():
+                self._log.debug("Skipping remaining columns, all rows are decided.")
+                break
+
+        return pd.DataFrame(result, index=df.index)
+
+    @staticmethod
+    def _compare_any(df, comparator, targets):
+        """
+        Compares a single column to several target values at once, using a
+        single membership check instead of one comparison per target.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Single-column data to compare.
+        comparator : Comparator
+            Either the "==" Comparator, marking values equal to any target,
+            or the "!=" Comparator, marking values equal to none of them.
+        targets : tuple
+            Target values to compare against.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Single-column DataFrame with comparison results.
+        """
+
+        dtype = df.dtypes.iloc[0]
+        if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(
+            dtype
+        ):
+            # Compare as the comparators do, floats in their own precision
+            ((_, values),) = Comparator.numeric_blocks(df)
+            values = values[:, 0]
+            targets = np.array([float(target) for target in targets])
+            if values.dtype.kind == "f":
+                targets = targets.astype(values.dtype)
+            found = np.isin(values, targets)
+
+        elif dtype == object or isinstance(dtype, pd.StringDtype):
+            found = df.iloc[:, 0].isin(targets).to_numpy(dtype=bool, na_value=False)
+
+        else:
+            equal = Comparator.get("==")
+            found = np.zeros(len(df), dtype=bool)
+            for target in targets:
+                found |= (
+                    equal(df, target).iloc[:, 0].to_numpy(dtype=bool, na_value=False)
+                )
 
-        return set(selected)
+        if comparator.symbol == "!=":
+            found = ~found
+        return pd.DataFrame(found, index=df.index)
 
-    # pylint: disable=too-many-arguments
-    def _evaluate_partial(self, df, columns, comparator, target, operator=None):
+    def _evaluate_partial(self, df, node, cache=None, rows=None):
         """
         Evaluate the partial expression against the provided data frame.
 
@@ -208,14 +832,12 @@ class Parser:
         ----------
         df : pandas.DataFrame
             Data set to evaluate the partial expression against.
-        columns : list
-            List of column names or regular expressions.
-        comparator : str
-            String identifying a Comparator class.
-        target : str
-            Target value to compare data against.
-        operator : Optional[str]
-            String identifying an Operator calss (if specified).
+        node : PartialExpression
+            Partial expression node to evaluate.
+        cache : Optional[dict]
+            Comparison results by comparator, target value and column name.
+        rows : Optional[numpy.ndarray]
+            Positions of the rows to evaluate, results are not cached then.
 
         Returns
         -------
@@ -224,46 +846,102 @@ class Parser:
         """
 
         # Process and log partial expression components
+        operator = node.operator_object or node.operator
         if operator:
-            operator = Operator.get(operator)
+            if not isinstance(operator, Operator):
+                operator = Operator.get(operator)
             self._log.debug("Using operator: %s.", operator.__class__.__name__)
 
-        columns = self._select_columns(df, columns)
-        self._log.debug("Selected columns: %s.", ", ".join(columns))
+        columns = node.select_columns(df)
+        if self._log.isEnabledFor(logging.DEBUG):
+            self._log.debug("Selected columns: %s.", ", ".join(columns))
 
-        comparator = Comparator.get(comparator)
+        comparator = node.comparator_object or Comparator.get(node.comparator)
         self._log.debug("Using comparator: %s.", comparator.__class__.__name__)
 
-        # Target is either constant or column reference
-        if target.startswith("{") and target.endswith("}"):
+        target = self._resolve_target(df, node.target)
+
+        # Perform comparison and operation
+        data = df[columns]
+        if rows is not None:
+            self._log.debug("Evaluating %d undecided rows.", len(rows))
+            data = data.iloc[rows]
+            if isinstance(target, pd.Series):
+                target = target.iloc[rows]
+            cache = None
+
+        if operator:
+            return self._apply_operator(data, comparator, target, operator, cache)
+
+        if len(columns) > 1:
+            raise RuntimeError(
+                f"Too many columns ({len(columns)}) to compare, either select "
+                "a single column or reduce columns using an operator."
+            )
+
+        if isinstance(target, tuple):
+            return self._compare_any(data, comparator, target)
+        return self._compare(data, comparator, target, cache)
+
+    def _resolve_target(self, df, target):
+        """
+        Resolves the target of a partial expression, which is either a
+        constant, a column reference such as "{column}" or folded constants.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Data set to take a referenced target column from.
+        target : Union[str, tuple]
+            Target value, column reference or tuple of target values.
+
+        Returns
+        -------
+        Union[str, tuple, pandas.Series]
+            Target value, referenced column or tuple of target values.
+        """
+
+        if isinstance(target, str) and target.startswith("{") and target.endswith("}"):
             target = target[1:-1]
             self._log.debug("Using target column: %s.", target)
 
             if target not in df.columns:
                 raise RuntimeError(f"Target column '{target}' does not exist.")
-            target = df[target]
+            return df[target]
 
-        else:
-            self._log.debug("Using target: %s.", target)
+        self._log.debug("Using target: %s.", target)
+        return target
 
-        # Perform comparison and operation
-        if operator:
-            if isinstance(operator, LogicalOperator):
-                result = df[columns].pipe(comparator, target=target).pipe(operator)
-            elif isinstance(operator, DataOperator):
-                result = df[columns].pipe(operator).pipe(comparator, target=target)
-            else:
-                raise TypeError(
-                    f"Unknown operator type: {operator.__class__.__name__}."
-                )
+    def _apply_operator(self, df, comparator, target, operator, cache=None):
+        """
+        Applies a Comparator and an Operator, comparing the results of a
+        LogicalOperator or the aggregate of a DataOperator.
 
-        else:
-            if len(columns) > 1:
-                raise RuntimeError(
-                    f"Too many columns ({len(columns)}) to compare, either select "
-                    "a single column or reduce columns using an operator."
-                )
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Data to compare.
+        comparator : Comparator
+            Comparator to apply.
+        target : Union[str, pandas.Series]
+            Target value or column to compare against.
+        operator : Operator
+            Operator reducing the columns.
+        cache : Optional[dict]
+            Comparison results by comparator, target value and column name.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Single-column DataFrame with validation results.
+        """
+
+        if isinstance(operator, LogicalOperator):
+            return self._compare_reduced(df, comparator, target, operator, cache)
 
-            result = df[columns].pipe(comparator, target=target)
+        if isinstance(operator, DataOperator):
+            if self._can_fuse(df, comparator):
+                return self._fused_partial(df, operator, comparator, target, cache)
+            return df.pipe(operator).pipe(comparator, target=target)
 
-        return result
+        raise TypeError(f"Unknown operator type: {operator.__class__.__name__}.")
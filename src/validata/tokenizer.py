@@ -1,12 +1,16 @@
 """Module containing a Tokenizer class for boolean expressions."""
 
+import re
 import string
 import logging
+import functools
 
 
 class Token:
     """Class for a single token."""
 
+    __slots__ = ("value", "type")
+
     def __init__(self, token_value, token_type):
         self.value = token_value
         self.type = token_type
@@ -25,7 +29,9 @@ class Tokenizer:
         Expression to generate tokens from.
     """
 
-    # Define token types
+    __slots__ = ("_log", "_types", "_scanner", "_tokens")
+
+    # Define default token types
     _token_types = {
         "(": "GROUP_OPEN",
         ")": "GROUP_CLOSE",
@@ -44,36 +50,69 @@ class Tokenizer:
     _word_boundary = string.whitespace + "()<>=&|"
     _punctuation = string.punctuation
 
-    # Initialize variables
-    _tokens = []
-    _lookup = []
-    _pointer = 0
-
     def __init__(self, expression, additional_types=None):
         self._log = logging.getLogger(__name__)
 
-        # Update tokens
+        # Update tokens, leaving the class defaults unchanged
+        self._types = dict(self._token_types)
         if additional_types:
-            self._token_types.update(additional_types)
+            self._types.update(additional_types)
 
-        # Tokenize the expression
-        self._lookup = self._build_lookup()
-        self._tokens = self._tokenize(expression)
-        self._pointer = 0
+        # Tokenize the expression, iterating uses a separate cursor
+        self._scanner = self._build_scanner(frozenset(self._types))
+        self._tokens = tuple(self._tokenize(expression))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _build_scanner(token_types):
+        """
+        Builds a single pattern scanning tokens, quoted strings, words and
+        punctuation, cached across Tokenizer instances.
 
-    def _build_lookup(self):
-        """Builds token type look-up lsit."""
+        Parameters
+        ----------
+        token_types : frozenset
+            Set of token strings to look up.
 
-        lookup = []
-        for token_type in sorted(self._token_types, key=len, reverse=True):
+        Returns
+        -------
+        re.Pattern
+            Pattern matching a single lexeme at any position, trying the longest
+            tokens first. The name of the matching group gives its kind.
+        """
+
+        boundary = re.escape(string.whitespace + string.punctuation)
+        alternatives = []
+        for token_type in sorted(token_types, key=len, reverse=True):
             # No bound checking for all punctuation tokens
-            bound_check = bool(set(token_type) - set(string.punctuation))
-            lookup.append((token_type, bound_check))
-        return lookup
+            if set(token_type) - set(string.punctuation):
+                alternatives.append(rf"{re.escape(token_type)}(?=[{boundary}]|\Z)")
+            else:
+                alternatives.append(re.escape(token_type))
+
+        # A backslash escapes the next character in quoted strings and words
+        quotes = re.escape("".join(Tokenizer._quote_styles))
+        word_boundary = re.escape(Tokenizer._word_boundary)
+        punctuation = re.escape(Tokenizer._punctuation.replace("\\", ""))
+        whitespace = re.escape(string.whitespace)
+        # Runs of whitespace are skipped in a single match, before trying tokens
+        kinds = [
+            rf"(?P<space>[{whitespace}]+)",
+            rf"(?P<quote>[{quotes}])(?P<quoted>(?:\\.|(?!(?P=quote))[^\\])*)(?P=quote)?",
+            rf"(?P<word>(?:\\.|[^{word_boundary}\\])+)",
+            rf"(?P<punctuation>(?:\\.|[{punctuation}])+)",
+            r"(?P<skip>.)",
+        ]
+        if alternatives:
+            # Only try the tokens if the first character may start one
+            first = re.escape("".join({token_type[0] for token_type in token_types}))
+            tokens = "|".join(alternatives)
+            kinds.insert(1, rf"(?P<token>(?=[{first}])(?:{tokens}))")
+        return re.compile("|".join(kinds), re.DOTALL)
 
     def _tokenize(self, expression):
         """
-        Generator for tokenizing a logical string.
+        Tokenizes a logical string in a single scan.
 
         Parameters
         ----------
@@ -82,117 +121,82 @@ class Tokenizer:
 
         Returns
         -------
-        Iterator
-            Iterator returning tokens from the logical expression.
+        list
+            List of tokens from the logical expression.
         """
 
         tokens = []
-        while expression:
+        debug = self._log.isEnabledFor(logging.DEBUG)
+        for match in self._scanner.finditer(expression):
+            kind = match.lastgroup
 
             # Check for a token
-            token, expression = self._capture_token(expression)
-            if token:
-                self._log.debug("Found token: %s [%s]", token.value, token.type)
+            if kind == "token":
+                token = Token(match.group(), self._types[match.group()])
+                if debug:
+                    self._log.debug("Found token: %s [%s]", token.value, token.type)
                 tokens.append(token)
 
             # Quoted string
-            elif expression[0] in self._quote_styles:
-                quote_style = self._quote_styles[expression[0]]
-                quoted_str, expression = self._capture(
-                    expression[1:], exclude=expression[0]
-                )
-                expression = expression[1:]
-                self._log.debug("Found quoted string: %s [%s]", quoted_str, quote_style)
+            elif kind in ("quote", "quoted"):
+                quote_style = self._quote_styles[match.group("quote")]
+                quoted_str = self._unescape(match.group("quoted"))
+                if debug:
+                    self._log.debug(
+                        "Found quoted string: %s [%s]", quoted_str, quote_style
+                    )
                 tokens.append(Token(quoted_str, quote_style))
 
             # Word characters
-            elif expression[0] not in self._word_boundary:
-                word_str, expression = self._capture(
-                    expression, exclude=self._word_boundary
-                )
-                self._log.debug("Found word: %s", word_str)
+            elif kind == "word":
+                word_str = self._unescape(match.group())
+                if debug:
+                    self._log.debug("Found word: %s", word_str)
                 tokens.append(Token(word_str, "WORD"))
 
             # Punctuation
-            elif expression[0] in self._punctuation:
-                punctuation_str, expression = self._capture(
-                    expression, include=self._punctuation
-                )
-                self._log.debug("Found punctuation: %s", punctuation_str)
+            elif kind == "punctuation":
+                punctuation_str = self._unescape(match.group())
+                if debug:
+                    self._log.debug("Found punctuation: %s", punctuation_str)
                 tokens.append(Token(punctuation_str, "PUNCTUATION"))
 
-            # Skip
-            else:
-                self._log.debug("Ignored character: '%s'", expression[0])
-                expression = expression[1:]
+            # Skip whitespace and other characters
+            elif debug:
+                self._log.debug("Ignored characters: '%s'", match.group())
 
         return tokens
 
     @staticmethod
-    def _bounded_startswith(token, expression, check):
-        """Checks for word boundary after token."""
-
-        if not expression.startswith(token):
-            return False
-        if check:
-            return (
-                token == expression
-                or expression[len(token)] in string.whitespace + string.punctuation
-            )
-        return True
-
-    def _capture_token(self, expression):
-        """
-        Searches for and captures tokens from a logical expression.
+    def _unescape(captured):
+        """Removes the backslashes escaping characters in a captured string."""
 
-        Parameters
-        ----------
-        expression : str
-            Expression to capture the substring from.
+        if "\\" in captured:
+            return re.sub(r"\\(.)", r"\1", captured, flags=re.DOTALL)
+        return captured
 
-        Returns
-        -------
-        Tuple[str, str]
-            Tuple of captured string and remainder of the logical expression.
-        """
+    def __iter__(self):
+        """Start iteration using a new cursor at the first token."""
 
-        for token, check in self._lookup:
-            if self._bounded_startswith(token, expression, check):
-                return Token(token, self._token_types[token]), expression[len(token) :]
-        return None, expression
+        return TokenCursor(self._tokens)
 
-    @staticmethod
-    def _capture(expression, exclude=None, include=None):
-        """
-        Captures a substring from a logical expression.
 
-        Parameters
-        ----------
-        expression : str
-            Expression to capture the substring from.
-        exclude : Union[list, str]
-            List or string of characters that end the substring pattern.
-        include : Union[list, str]
-            List or string of characters that should be included in the substring.
+class TokenCursor:
+    """
+    Cursor moving over the tokens of a Tokenizer. The tokens are shared, so
+    several cursors can move over the same tokens independently.
 
-        Returns
-        -------
-        Tuple[str, str]
-            Tuple of captured string and remainder of the logical expression.
-        """
+    Parameters
+    ----------
+    tokens : tuple
+        Tokens to move over.
+    """
 
-        captured = ""
-        while expression:
-            if expression[0] == "\\":
-                expression = expression[1:]
-            elif include and expression[0] not in include:
-                break
-            elif exclude and expression[0] in exclude:
-                break
-            captured += expression[0]
-            expression = expression[1:]
+    __slots__ = ("_tokens", "_pointer")
 
-        return captured, expression
+    def __init__(self, tokens):
+        self._tokens = tokens
+        self._pointer = 0
 
     def peek(self):
         """Peeks ahead at the next token."""
@@ -217,7 +221,7 @@ class Tokenizer:
         return self._pointer < len(self._tokens)
 
     def __iter__(self):
-        """Start iteration, resets the pointer."""
+        """Continue iteration from the current token."""
 
         return self
 
@@ -225,7 +229,6 @@ class Tokenizer:
         """Returns the next token."""
 
         if not self.has_next():
-            # self._pointer = 0
             raise StopIteration
 
         token = self._tokens[self._pointer]
@@ -1,9 +1,54 @@
 """Module containing the Validator class for performing data validation."""
 
+import functools
 import logging
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pandas as pd
 
 from validata.parser import Parser
+from validata.comparators import Comparator
+from validata.operators import Operator
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile(expression, registered):  # pylint: disable=unused-argument
+    """
+    Parses an expression, sharing the Parser between Validators using the same
+    expression while the same Comparators and Operators are registered.
+    Parsers are not changed by evaluating them, except for the columns
+    selected per data schema.
+
+    Parameters
+    ----------
+    expression : str
+        Boolean expression for a validation check.
+    registered : tuple
+        Registered Comparators and Operators, see `_registered()`. Only used
+        as part of the cache key.
+
+    Returns
+    -------
+    Parser
+        Parser for the expression.
+    """
+
+    return Parser(expression)
+
+
+def _registered():
+    """
+    Identifies the registered Comparators and Operators by their symbols and
+    shared instances, which are replaced when a subclass registers a symbol.
+    """
+
+    return (
+        frozenset((symbol, Comparator.get(symbol)) for symbol in Comparator.list()),
+        frozenset((symbol, Operator.get(symbol)) for symbol in Operator.list()),
+    )
 
 
 class Validator:
@@ -25,6 +70,9 @@ class Validator:
     _required = ["name", "expression"]
     _results = None
 
+    # Number of earlier validation results kept for cached validations
+    _max_cached = 8
+
     def __init__(self, df_checks):
         self._log = logging.getLogger(__name__)
 
@@ -32,6 +80,18 @@ class Validator:
         self._check_validations(df_checks)
         self._checks = df_checks[self._required]
 
+        # Earlier validation results by DataFrame identity
+        self._cached = OrderedDict()
+
+        # Tokenize expressions once, parsers are reused for every validation
+        registered = _registered()
+        self._parsers = [
+            (name, _compile(expression, registered))
+            for name, expression in zip(
+                self._checks["name"], self._checks["expression"]
+            )
+        ]
+
     def _check_validations(self, df_checks):
         """
         Checks whether validations are correctly specified.
@@ -51,7 +111,14 @@ class Validator:
                 f"Missing columns from validation definitions: {', '.join(missing)}."
             )
 
-    def validate(self, df):
+        duplicated = df_checks["name"][df_checks["name"].duplicated()].unique()
+        if len(duplicated):
+            raise RuntimeError(
+                "Duplicate names in validation definitions: "
+                f"{', '.join(map(str, duplicated))}."
+            )
+
+    def validate(self, df, cached=False, n_workers=None, mode=None):
         """
         Validates a pandas DataFrame against the checks provided to the
         Validator class.
@@ -60,6 +127,18 @@ class Validator:
         ----------
         df : pandas.DataFrame
             DataFrame containing the data to be validated.
+        cached : Optional[bool]
+            Reuse the results of an earlier cached validation of the same
+            DataFrame object with unchanged columns, dtypes and shape (default
+            False). Note that in-place changes to the data are not detected.
+        n_workers : Optional[int]
+            Number of threads evaluating validation checks concurrently,
+            checks are evaluated one by one if omitted (default None).
+        mode : Optional[str]
+            Evaluate all checks on all rows (None, default), or use "and" to
+            evaluate each check only on the rows passing all earlier checks.
+            Results of rows failing an earlier check are then set to False,
+            and checks are evaluated one by one.
 
         Returns
         -------
@@ -67,26 +146,190 @@ class Validator:
             DataFrame with one column for each validation check.
         """
 
-        # Looping over the validation checks
-        results = pd.DataFrame(index=df.index)
-        for name, expression in self._checks.to_records(index=False):
-            self._log.debug("Performing validation: %s.", name)
+        if mode not in (None, "and"):
+            raise ValueError(f"Unknown validation mode: '{mode}'.")
 
-            parser = Parser(expression)
-            result = parser.evaluate(df)
+        if cached:
+            key = self._cache_key(df) + (mode,)
+            if key in self._cached:
+                data_ref, results = self._cached[key]
+                if data_ref() is df:
+                    self._log.debug("Reusing cached validation results.")
+                    self._cached.move_to_end(key)
+                    self._results = results
+                    return results.copy()
 
-            results[name] = result
+        # Looping over the validation checks, filling one column per check
+        evaluated = self._evaluate(df, n_workers, mode)
+        debug = self._log.isEnabledFor(logging.DEBUG)
+        values = np.empty((len(df), len(self._parsers)), dtype=bool)
+        for i, ((name, _), result) in enumerate(zip(self._parsers, evaluated)):
+            self._log.debug("Performing validation: %s.", name)
 
-            self._log.debug(
-                "Validated %d rows - %0.0f%% evaluated to True.",
-                len(result),
-                100 * result.sum()[0] / len(result),
-            )
-            self._log.debug("Finished validation: %s.", name)
+            if result.dtype != bool:
+                raise TypeError(
+                    f"Validation '{name}' returned {result.dtype} values "
+                    "instead of booleans."
+                )
+            values[:, i] = result
+
+            # Only count the positive results when they are logged
+            if debug:
+                self._log.debug(
+                    "Validated %d rows - %0.0f%% evaluated to True.",
+                    len(result),
+                    100 * result.mean() if len(result) else 0,
+                )
+                self._log.debug("Finished validation: %s.", name)
 
+        results = pd.DataFrame(
+            values, index=df.index, columns=[name for name, _ in self._parsers]
+        )
         self._results = results
+        if cached:
+            self._cache_results(key, df, results)
+            return results.copy()
         return results
 
+    def _evaluate(self, df, n_workers, mode):
+        """
+        Evaluates all validation checks, see `validate()`.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            DataFrame containing the data to be validated.
+        n_workers : Optional[int]
+            Number of threads evaluating validation checks concurrently.
+        mode : Optional[str]
+            Evaluate all checks on all rows (None), or only on the rows
+            passing all earlier checks ("and").
+
+        Returns
+        -------
+        Iterable[numpy.ndarray]
+            Results of each validation check.
+        """
+
+        parsers = [parser for _, parser in self._parsers]
+        if mode == "and":
+            return self._evaluate_passing(df, parsers)
+
+        cache = self._compare_shared(df, parsers)
+
+        # Evaluate checks in threads, NumPy and pandas release the GIL for
+        # most of the work. Otherwise checks are evaluated while looping.
+        if n_workers is not None and n_workers > 1 and len(parsers) > 1:
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                return list(
+                    executor.map(
+                        lambda parser: parser.evaluate_values(df, cache), parsers
+                    )
+                )
+        return (parser.evaluate_values(df, cache) for parser in parsers)
+
+    def _evaluate_passing(self, df, parsers):
+        """
+        Evaluates validation checks one by one, each only on the rows passing
+        all earlier checks. Checks comparing rows to other rows, for example
+        by rank, are evaluated on all rows to keep their results unchanged.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            DataFrame containing the data to be validated.
+        parsers : List[Parser]
+            Parsers for all validation checks.
+
+        Yields
+        ------
+        numpy.ndarray
+            Results of each validation check, False for rows failing an
+            earlier check.
+        """
+
+        # Comparisons are cached for checks evaluated on all rows only
+        cache = {}
+        passing = np.ones(len(df), dtype=bool)
+        for parser in parsers:
+            rows = np.flatnonzero(passing)
+            if len(rows) == len(df) or not parser.rowwise:
+                result = parser.evaluate_values(df, cache)
+                if result.dtype == bool:
+                    result = result & passing
+            else:
+                self._log.debug("Evaluating %d passing rows.", len(rows))
+                result = np.zeros(len(df), dtype=bool)
+                if len(rows):
+                    result[rows] = parser.evaluate_values(df.iloc[rows])
+                else:
+                    parser.check(df)
+
+            if result.dtype == bool:
+                passing &= result
+            yield result
+
+    @staticmethod
+    def _cache_key(df):
+        """Identifies a DataFrame by object identity and schema."""
+
+        return id(df), df.shape, tuple(df.columns), tuple(map(str, df.dtypes))
+
+    def _cache_results(self, key, df, results):
+        """
+        Stores validation results, dropping them when the DataFrame is garbage
+        collected or when they are the least recently used.
+        """
+
+        data_ref = weakref.ref(df, lambda _: self._cached.pop(key, None))
+        self._cached[key] = data_ref, results
+        self._cached.move_to_end(key)
+        while len(self._cached) > self._max_cached:
+            self._cached.popitem(last=False)
+
+    @staticmethod
+    def _compare_shared(df, parsers):
+        """
+        Applies Comparators that several validation checks share with the
+        same target value only once, on the union of their columns. Columns
+        are compared per dtype, so each column is compared as it would be on
+        its own.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            DataFrame containing the data to be validated.
+        parsers : List[Parser]
+            Parsers for all validation checks.
+
+        Returns
+        -------
+        dict
+            Comparison results by comparator, target value and column name.
+        """
+
+        shared = {}
+        for parser in parsers:
+            for comparator, target, columns in parser.comparisons(df):
+                shared.setdefault((comparator, target), []).append(columns)
+
+        cache = {}
+        for (comparator, target), selections in shared.items():
+            if len(selections) < 2:
+                continue
+
+            columns = list(dict.fromkeys(col for cols in selections for col in cols))
+            blocks = {}
+            for col, dtype in df[columns].dtypes.items():
+                blocks.setdefault(dtype, []).append(col)
+
+            for block in blocks.values():
+                compared = Comparator.get(comparator)(df[block], target=target)
+                for col in block:
+                    cache[comparator, target, col] = compared[col]
+
+        return cache
+
     def get_summary(self, per="validation", percentage=True):
         """
         Get a summary of the last validation run.
@@ -96,7 +339,7 @@ class Validator:
         per : Optional[str]
             String indicating whether to summarize per validation (default)
             or per case.
-        pecentage : Optional[bool]
+        percentage : Optional[bool]
             Report percentages (True, default) or counts (False).
 
         Returns
@@ -108,8 +351,12 @@ class Validator:
         if self._results is None:
             raise RuntimeError("No validation has run yet, call validate() first.")
 
+        # Count positive results on the boolean array, skipping pandas' sum
         axis = 1 if per == "case" else 0
-        summary = self._results.sum(axis=axis)
+        summary = pd.Series(
+            np.count_nonzero(self._results.to_numpy(dtype=bool), axis=axis),
+            index=self._results.axes[1 - axis],
+        )
 
         name = "positive"
         if percentage:
@@ -1,7 +1,10 @@
 """Module for unit testing Operator classes."""
 
+import numpy as np
 import pandas as pd
+import pytest
 
+from validata.comparators import Comparator
 from base_classes import BaseComparatorTests
 
 
@@ -14,6 +17,7 @@ DUMMY_DATA = pd.DataFrame(
         "float_miss": [1.1, None, 3.3, None],
         "str": ["A", "B", "C", "D"],
         "str_miss": ["A", None, "C", None],
+        "cat": pd.Categorical(["A", "B", "A", None]),
     }
 )
 
@@ -33,6 +37,33 @@ class TestEqComparator(BaseComparatorTests):
     )
 
 
+class TestEqComparatorCategorical(BaseComparatorTests):
+    """Tests for the EqComparator class on categorical data."""
+
+    comparator = "=="
+    data = DUMMY_DATA[["cat", "str"]]
+    target = "A"
+    expected = pd.DataFrame(
+        {"cat": [True, False, True, False], "str": [True, False, False, False]}
+    )
+
+
+class TestEqComparatorMixedFloat(BaseComparatorTests):
+    """Tests for the EqComparator class on float32 and float64 data."""
+
+    comparator = "=="
+    data = pd.DataFrame(
+        {
+            "float32": np.array([1.0, 2.2, 3.0], dtype="float32"),
+            "float64": [1.0, 2.2, 3.0],
+        }
+    )
+    target = 2.2
+    expected = pd.DataFrame(
+        {"float32": [False, True, False], "float64": [False, True, False]}
+    )
+
+
 class TestUnEqComparator(BaseComparatorTests):
     """Tests for the EqComparator class."""
 
@@ -59,6 +90,17 @@ class TestGtComparator(BaseComparatorTests):
     )
 
 
+class TestGtComparatorFloat32(BaseComparatorTests):
+    """Tests for the GtComparator class on float32 data."""
+
+    comparator = ">"
+    data = DUMMY_DATA[["float", "float_miss"]].astype("float32")
+    target = "2.2"
+    expected = pd.DataFrame(
+        {"float": [False, False, True, True], "float_miss": [False, False, True, False]}
+    )
+
+
 class TestGtEqComparator(BaseComparatorTests):
     """Tests for the GtEqComparator class."""
 
@@ -74,6 +116,27 @@ class TestGtEqComparator(BaseComparatorTests):
     )
 
 
+class TestGtComparatorMixedFloat(BaseComparatorTests):
+    """Tests for the GtComparator class on float32 and float64 data."""
+
+    comparator = ">"
+    data = pd.DataFrame(
+        {
+            "float32": np.array([1.0, 2.2, 3.0], dtype="float32"),
+            "float64": [1.0, 2.2, 3.0],
+            "int": [1, 2, 3],
+        }
+    )
+    target = 2.2
+    expected = pd.DataFrame(
+        {
+            "float32": [False, False, True],
+            "float64": [False, False, True],
+            "int": [False, False, True],
+        }
+    )
+
+
 class TestLtComparator(BaseComparatorTests):
     """Tests for the LtComparator class."""
 
@@ -119,6 +182,17 @@ class TestInComparator(BaseComparatorTests):
     )
 
 
+class TestInComparatorCategorical(BaseComparatorTests):
+    """Tests for the InComparator class on categorical data."""
+
+    comparator = "in"
+    data = DUMMY_DATA[["cat", "str_miss"]]
+    target = "A, B"
+    expected = pd.DataFrame(
+        {"cat": [True, True, True, False], "str_miss": [True, False, False, False]}
+    )
+
+
 class TestBetweenComparator(BaseComparatorTests):
     """Tests for the BetweenComparator class."""
 
@@ -189,3 +263,108 @@ class TestOutlierComparator(BaseComparatorTests):
     expected = pd.DataFrame(
         {"x": [True, True] + [False] * 10, "y": [True] + [False] * 11,}
     )
+
+
+class TestMixedDtypes:
+    """Tests whether columns are compared the same regardless of others."""
+
+    data = pd.DataFrame(
+        {
+            "int": [1, 2, 3, 2],
+            "int_na": pd.array([1, None, 2, 2], dtype="Int64"),
+            "float32": np.array([1.0, 2.0, 2.5, 2.2], dtype="float32"),
+            "str": ["1", "2", "2.5", None],
+            "cat": pd.Categorical(["2", "1", "2", None]),
+        }
+    )
+
+    @pytest.mark.parametrize("comparator", ["==", "!="])
+    @pytest.mark.parametrize("target", ["2", "2.5", "2.2"])
+    def test_result_per_column(self, comparator, target):
+        """Test comparing all columns at once and one by one."""
+
+        comparator = Comparator.get(comparator)
+        numeric = ["int", "int_na", "float32"]
+        result = comparator(self.data[numeric + ["str", "cat"]], target)
+        for col in result.columns:
+            expected = comparator(self.data[[col]], target)
+            pd.testing.assert_series_equal(result[col], expected[col])
+
+
+class TestInPlaceChanges:
+    """Tests whether comparisons reflect in-place changes to the data."""
+
+    def test_mixed_numeric(self):
+        """Test comparing mixed numeric data again after changing a value."""
+
+        data = pd.DataFrame({"a": [1, 2, 3], "b": [1.5, 2.5, 3.5]})
+        comparator = Comparator.get(">")
+        assert comparator(data, 2)["a"].tolist() == [False, False, True]
+
+        data.loc[0, "a"] = 10
+        assert comparator(data, 2)["a"].tolist() == [True, False, True]
+
+    def test_rank(self):
+        """Test ranking data again after changing a value."""
+
+        data = pd.DataFrame({"a": [1, 2, 3, 4]})
+        comparator = Comparator.get("ranks in")
+        assert comparator(data, "top 1")["a"].tolist() == [False] * 3 + [True]
+
+        data.loc[0, "a"] = 10
+        assert comparator(data, "top 1")["a"].tolist() == [True] + [False] * 3
+
+    def test_outlier(self):
+        """Test detecting outliers again after changing a value."""
+
+        data = pd.DataFrame({"a": [0.0] * 11 + [1.0]})
+        comparator = Comparator.get("is outlier by")
+        assert comparator(data, "2 SD")["a"].tolist() == [False] * 11 + [True]
+
+        data.loc[[0, 11], "a"] = [1.0, 0.0]
+        assert comparator(data, "2 SD")["a"].tolist() == [True] + [False] * 11
+
+
+class TestReductions:
+    """Tests for reusing reductions of the data within one evaluation."""
+
+    def test_rank_reuses_reductions(self):
+        """Test whether ranks are stored and reused for other thresholds."""
+
+        data = pd.DataFrame({"a": [1, 2, 3, 4]})
+        comparator = Comparator.get("ranks in")
+        reductions = {}
+        top_1 = comparator(data, "top 1", reductions=reductions)
+        assert list(reductions) == [("rank", False, False)]
+
+        top_2 = comparator(data, "top 2", reductions=reductions)
+        assert len(reductions) == 1
+        assert top_1["a"].tolist() == [False] * 3 + [True]
+        assert top_2["a"].tolist() == [False] * 2 + [True] * 2
+
+    def test_outlier_reuses_reductions(self):
+        """Test whether statistics are stored and reused for other whiskers."""
+
+        data = pd.DataFrame({"a": [-6, 8] + [0] * 10})
+        comparator = Comparator.get("is outlier by")
+        reductions = {}
+        expected = comparator(data, "1 SD")
+        comparator(data, "2 SD", reductions=reductions)
+        result = comparator(data, "1 SD", reductions=reductions)
+        assert list(reductions) == [("mean_sd",)]
+        pd.testing.assert_frame_equal(result, expected)
+
+
+class TestRegistry:
+    """Tests for registering Comparator subclasses."""
+
+    def test_inherited_symbol(self):
+        """Test whether subclasses inheriting a symbol leave the registry."""
+
+        equal = Comparator.get("==")
+
+        # pylint: disable=unused-variable
+        class TweakedEqComparator(type(equal)):
+            """Subclass of the EqComparator without a symbol of its own."""
+
+        assert Comparator.get("==") is equal
@@ -1,9 +1,14 @@
 """Module for unit testing Operator classes."""
 
+import warnings
+
+import numpy as np
 import pandas as pd
+import pytest
 
-from base_classes import BaseOperatorTests
+from validata.operators import Operator
 
+from base_classes import BaseOperatorTests
 
 # Dummy data for unit tests
 DUMMY_DATA = pd.DataFrame(
@@ -78,3 +83,60 @@ class TestNoneOperator(BaseOperatorTests):
     operator = "none"
     data = DUMMY_DATA[["bool", "bool_miss"]]
     expected = pd.DataFrame({0: [False, False, True, True]})
+
+
+class TestMissingRows:
+    """Tests for reducing rows with only missing values."""
+
+    data = pd.DataFrame({"x": [1.0, None, 3.0], "y": [2.0, None, None]})
+
+    @pytest.mark.parametrize(
+        "operator, expected",
+        [
+            ("mean", [1.5, np.nan, 3.0]),
+            ("median", [1.5, np.nan, 3.0]),
+            ("min", [1.0, np.nan, 3.0]),
+            ("max", [2.0, np.nan, 3.0]),
+            ("sum", [3.0, 0.0, 3.0]),
+        ],
+    )
+    def test_result(self, operator, expected):
+        """Test the result for missing rows, without warnings."""
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            result = Operator.get(operator)(self.data)
+        pd.testing.assert_frame_equal(result, pd.DataFrame({0: expected}))
+
+
+class TestDataTypes:
+    """Tests for the data types DataOperator classes accept."""
+
+    @pytest.mark.parametrize("operator", ["mean", "median", "min", "max", "sum"])
+    @pytest.mark.parametrize(
+        "data",
+        [
+            pd.DataFrame({"str": ["a", "b"], "int": [1, 2]}),
+            pd.DataFrame({"date": pd.to_datetime(["2020-01-01", "2020-01-02"])}),
+        ],
+    )
+    def test_not_numeric(self, operator, data):
+        """Test whether non-numeric columns raise."""
+
+        with pytest.raises(TypeError, match="did not match dtype 'number'"):
+            Operator.get(operator)(data)
+
+
+class TestRegistry:
+    """Tests for registering Operator subclasses."""
+
+    def test_inherited_symbol(self):
+        """Test whether subclasses inheriting a symbol leave the registry."""
+
+        mean = Operator.get("mean")
+
+        # pylint: disable=unused-variable
+        class TweakedMeanOperator(type(mean)):
+            """Subclass of the MeanOperator without a symbol of its own."""
+
+        assert Operator.get("mean") is mean
@@ -0,0 +1,299 @@
+"""Module for unit testing the Parser class."""
+
+import logging
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from validata.comparators import Comparator
+from validata.operators import Operator
+from validata.parser import Parser
+
+# Dummy data for unit tests
+DUMMY_DATA = pd.DataFrame(
+    {
+        "int": [1, 2, 3, 4],
+        "int_miss": [1, None, 3, None],
+        "str": ["A", "B", "C", "D"],
+    }
+)
+
+
+class TestConfigurationErrors:
+    """Tests whether errors in expressions raise, even if skipped."""
+
+    @pytest.mark.parametrize(
+        "expression",
+        [
+            "typo_col == 1",
+            "int > 100 & typo_col == 1",
+            "int > 0 | typo_col == 1",
+            "int > 100 & (int_miss missing | typo_col == 1)",
+            "int > 100 & any typo_* == 1",
+        ],
+    )
+    def test_missing_column(self, expression):
+        """Test whether a missing column raises."""
+
+        with pytest.raises(RuntimeError, match="typo_"):
+            Parser(expression).evaluate(DUMMY_DATA)
+
+    def test_missing_target_column(self):
+        """Test whether a missing target column raises."""
+
+        with pytest.raises(RuntimeError, match="typo_col"):
+            Parser("int > 100 & int == {typo_col}").evaluate(DUMMY_DATA)
+
+    @pytest.mark.parametrize(
+        "expression", ["()", "int > 1 & ()", "() & int > 1", "int > 1 | (())"]
+    )
+    def test_empty_group(self, expression):
+        """Test whether parentheses without expression raise."""
+
+        with pytest.raises(ValueError, match="parentheses"):
+            Parser(expression)
+
+    @pytest.mark.parametrize(
+        "expression",
+        [
+            "str > 1 & int missing",
+            "str > 1 | int not missing",
+            "int missing & (str between 1:2 | str > 1)",
+            "int missing & any str + int > 1",
+            "int missing & int contains A",
+            "sum str + int > 1",
+            "int missing & sum str + int > 1",
+            "int > 0 | mean str + int > 1",
+        ],
+    )
+    def test_invalid_dtype(self, expression):
+        """Test whether comparing an invalid data type raises."""
+
+        with pytest.raises(TypeError, match="did not match dtype"):
+            Parser(expression).evaluate(DUMMY_DATA)
+
+    def test_aggregate_dtype(self):
+        """Test whether only the aggregate is checked for a DataOperator."""
+
+        result = Parser("int missing & sum int + int_miss > 1").evaluate(DUMMY_DATA)
+        assert not result.iloc[:, 0].any()
+
+
+# Data with one column per dtype, for comparing folded equality checks
+FOLD_DATA = pd.DataFrame(
+    {
+        "int": [1, 2, 3, 2, 1],
+        "float32": np.array([1.0, 2.2, 3.0, 2.2, np.nan], dtype="float32"),
+        "int_na": pd.array([1, None, 3, 2, None], dtype="Int64"),
+        "str": ["1", "2.2", "3", None, "A"],
+        "cat": pd.Categorical(["1", "2.2", None, "3", "1"]),
+        "bool": [True, False, True, False, True],
+    }
+)
+
+
+class TestFoldedComparisons:
+    """Tests for equality checks folded into a single comparison."""
+
+    @staticmethod
+    def _unfolded(column, comparator, targets, logic):
+        """Combines the results of comparing to each target separately."""
+
+        results = [
+            Parser(f"{column} {comparator} {target}").evaluate_values(FOLD_DATA)
+            for target in targets
+        ]
+        combine = np.logical_or if logic == "|" else np.logical_and
+        return combine.reduce(results)
+
+    @staticmethod
+    def _evaluated(expression, caplog):
+        """Evaluates an expression, recording the partial expressions."""
+
+        caplog.clear()
+        with caplog.at_level(logging.DEBUG, logger="validata.parser"):
+            result = Parser(expression).evaluate_values(FOLD_DATA)
+        partials = [
+            record.args[0]
+            for record in caplog.records
+            if record.msg.startswith("Evaluating partial expression")
+        ]
+        return result, partials
+
+    @pytest.mark.parametrize("column", ["int", "float32", "int_na", "str", "cat"])
+    @pytest.mark.parametrize(
+        "comparator, logic", [("==", "|"), ("!=", "&")], ids=["eq", "uneq"]
+    )
+    @pytest.mark.parametrize("targets", [("1", "2.2"), ("3", "1", "2")])
+    def test_folded_result(self, column, comparator, logic, targets, caplog):
+        """Test whether folding leaves the results unchanged."""
+
+        expression = f" {logic} ".join(
+            f"{column} {comparator} {target}" for target in targets
+        )
+        result, partials = self._evaluated(expression, caplog)
+        assert len(partials) == 1
+        assert partials[0].target == targets
+
+        expected = self._unfolded(column, comparator, targets, logic)
+        np.testing.assert_array_equal(result, expected)
+
+    @pytest.mark.parametrize(
+        "comparator, logic", [("==", "|"), ("!=", "&")], ids=["eq", "uneq"]
+    )
+    def test_folded_bool(self, comparator, logic):
+        """Test folding checks of a boolean column."""
+
+        expression = f"bool {comparator} True {logic} bool {comparator} False"
+        result = Parser(expression).evaluate_values(FOLD_DATA)
+        expected = self._unfolded("bool", comparator, ("True", "False"), logic)
+        np.testing.assert_array_equal(result, expected)
+
+    @pytest.mark.parametrize(
+        "expression",
+        [
+            "int == 1 | float32 == 1",
+            "int == 1 & int == 2",
+            "int != 1 | int != 2",
+            "int == 1 | int != 2",
+            "int == 1 | int == {int}",
+            "any int + float32 == 1 | any int + float32 == 2",
+        ],
+    )
+    def test_not_folded(self, expression, caplog):
+        """Test whether other combinations are not folded."""
+
+        _, partials = self._evaluated(expression, caplog)
+        assert len(partials) == 2
+        assert not any(isinstance(partial.target, tuple) for partial in partials)
+
+    def test_folded_in_chain(self):
+        """Test folding inequality checks within a longer and chain."""
+
+        expression = "int != 1 & int != 2 & str not missing & int != 3"
+        result = Parser(expression).evaluate_values(FOLD_DATA)
+        np.testing.assert_array_equal(result, [False] * 5)
+
+        expression = "str not missing & int != 1 & int != 2"
+        result = Parser(expression).evaluate_values(FOLD_DATA)
+        np.testing.assert_array_equal(result, [False, False, True, False, False])
+
+
+# Data for evaluating expressions on the undecided rows only
+UNDECIDED_DATA = pd.DataFrame(
+    {
+        "x": [1, 2, 3, 4, 5, 6, 7, 8],
+        "y": [8.0, None, 6.0, 5.0, None, 3.0, 2.0, 1.0],
+        "z": [1.0, 2.0, 7.0, 1.0, 2.0, 7.0, 1.0, 0.0],
+        "s": ["a", "b", "a", None, "b", "a", "b", "a"],
+    }
+)
+
+
+class TestUndecidedRows:
+    """Tests for evaluating the right hand side on undecided rows only."""
+
+    @pytest.mark.parametrize(
+        "left, logic, right",
+        [
+            ("x > 5", "&", "y > 1"),
+            ("x > 3", "|", "y > 7"),
+            ("x > 5", "&", "y > {z}"),
+            ("x > 3", "|", "s == {s}"),
+            ("x > 5", "&", "sum y + z > 3"),
+            ("x > 3", "|", "mean y + z < 3"),
+            ("x > 5", "&", "any y + z > 2"),
+            ("x > 4", "&", "s contains a"),
+            ("x > 2", "&", "(y > 1 | z > 5)"),
+            ("(x > 5 | x < 2)", "&", "any y + z > 2"),
+        ],
+    )
+    def test_same_results(self, left, logic, right, caplog):
+        """Test whether results equal those evaluating all rows."""
+
+        combine = np.logical_and if logic == "&" else np.logical_or
+        expected = combine(
+            Parser(left).evaluate_values(UNDECIDED_DATA),
+            Parser(right).evaluate_values(UNDECIDED_DATA),
+        )
+
+        with caplog.at_level(logging.DEBUG, logger="validata.parser"):
+            result = Parser(f"{left} {logic} {right}").evaluate_values(UNDECIDED_DATA)
+        assert "undecided rows" in caplog.text
+        np.testing.assert_array_equal(result, expected)
+
+    def test_not_rowwise(self, caplog):
+        """Test whether comparing rows to other rows uses all rows."""
+
+        with caplog.at_level(logging.DEBUG, logger="validata.parser"):
+            result = Parser("x > 3 | y ranks in top 2").evaluate_values(UNDECIDED_DATA)
+        assert "undecided rows" not in caplog.text
+        np.testing.assert_array_equal(
+            result, [True, False, True, True, True, True, True, True]
+        )
+
+
+class TestColumnBlocks:
+    """Tests for reducing many columns block by block."""
+
+    @staticmethod
+    def _data(fill):
+        """Creates data with 150 columns, mostly filled with a value."""
+
+        rng = np.random.default_rng(0)
+        values = np.full((20, 150), fill, dtype=float)
+        values[rng.random(values.shape) < 0.05] = 1.0
+        values[rng.random(values.shape) < 0.05] = np.nan
+        values[0] = fill
+        values[1] = np.nan
+        return pd.DataFrame(values, columns=[f"c_{i}" for i in range(150)])
+
+    @pytest.mark.parametrize("operator", ["any", "all", "none"])
+    @pytest.mark.parametrize("comparator", ["==", "!=", "missing", "not missing"])
+    @pytest.mark.parametrize("fill", [0.0, 1.0])
+    def test_same_results(self, operator, comparator, fill):
+        """Test whether results equal those comparing all columns at once."""
+
+        data = self._data(fill)
+        target = "" if "missing" in comparator else "1"
+        expression = f"{operator} c_* {comparator} {target}"
+
+        compared = Comparator.get(comparator)(data, target)
+        expected = Operator.get(operator)(compared).iloc[:, 0].to_numpy()
+
+        result = Parser(expression).evaluate_values(data)
+        np.testing.assert_array_equal(result, expected)
+
+
+class TestAggregates:
+    """Tests for comparing the aggregate of a DataOperator."""
+
+    @pytest.mark.parametrize("operator", ["mean", "sum", "max"])
+    @pytest.mark.parametrize(
+        "comparator, target", [(">", "2"), ("between", "1:4"), ("missing", "")]
+    )
+    def test_same_results(self, operator, comparator, target):
+        """Test whether results equal those aggregating and comparing."""
+
+        expression = f"{operator} int + int_miss {comparator} {target}"
+        result = Parser(expression).evaluate_values(DUMMY_DATA)
+
+        data = DUMMY_DATA[["int", "int_miss"]]
+        aggregate = Operator.get(operator)(data)
+        expected = Comparator.get(comparator)(aggregate, target).iloc[:, 0]
+        np.testing.assert_array_equal(result, expected.to_numpy())
+
+
+class TestCache:
+    """Tests for the results kept in the cache while evaluating."""
+
+    def test_no_selections(self):
+        """Test whether selections of the data are not kept in the cache."""
+
+        cache = {}
+        Parser("int > 1 | (int_miss missing & str == A)").evaluate_values(
+            DUMMY_DATA, cache
+        )
+        assert cache
+        assert not any(isinstance(value, pd.DataFrame) for value in cache.values())
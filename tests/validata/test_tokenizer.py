@@ -0,0 +1,217 @@
+"""Module for unit testing the Tokenizer class."""
+
+import pytest
+
+from validata.comparators import Comparator
+from validata.operators import Operator
+from validata.tokenizer import Tokenizer
+
+# Token types as used by the Parser
+TOKEN_TYPES = {op: "OPERATOR" for op in Operator.list()}
+TOKEN_TYPES.update({comp: "COMPARATOR" for comp in Comparator.list()})
+
+
+def _tokenize(expression):
+    """Tokenizes an expression, returning tuples of token value and type."""
+
+    return [(token.value, token.type) for token in Tokenizer(expression, TOKEN_TYPES)]
+
+
+class TestTokenizer:
+    """Tests for tokenizing expressions."""
+
+    def test_expression(self):
+        """Test tokenizing a basic expression with grouping and logic."""
+
+        assert _tokenize("(x == 1 & y missing) | z > 2.5") == [
+            ("(", "GROUP_OPEN"),
+            ("x", "WORD"),
+            ("==", "COMPARATOR"),
+            ("1", "WORD"),
+            ("&", "AND"),
+            ("y", "WORD"),
+            ("missing", "COMPARATOR"),
+            (")", "GROUP_CLOSE"),
+            ("|", "OR"),
+            ("z", "WORD"),
+            (">", "COMPARATOR"),
+            ("2.5", "WORD"),
+        ]
+
+    def test_without_spaces(self):
+        """Test tokenizing punctuation tokens without surrounding spaces."""
+
+        assert _tokenize("x>=-1&(y<2)") == [
+            ("x", "WORD"),
+            (">=", "COMPARATOR"),
+            ("-1", "WORD"),
+            ("&", "AND"),
+            ("(", "GROUP_OPEN"),
+            ("y", "WORD"),
+            ("<", "COMPARATOR"),
+            ("2", "WORD"),
+            (")", "GROUP_CLOSE"),
+        ]
+
+    @pytest.mark.parametrize(
+        "expression, expected",
+        [
+            ("x == 'a b'", ("a b", "QUOTED STRING")),
+            ('x == "a & b"', ("a & b", "QUOTED STRING")),
+            ("x == ''", ("", "QUOTED STRING")),
+            ("x == 'it\\'s'", ("it's", "QUOTED STRING")),
+            ('x == "a\\"b"', ('a"b', "QUOTED STRING")),
+            ("x == 'a\"b'", ('a"b', "QUOTED STRING")),
+            ("x == 'a\\\\b'", ("a\\b", "QUOTED STRING")),
+            ("x contains `^[a-z]+ (b|c)$`", ("^[a-z]+ (b|c)$", "REGEX")),
+        ],
+    )
+    def test_quoted(self, expression, expected):
+        """Test tokenizing quoted strings and regular expressions."""
+
+        assert _tokenize(expression)[-1] == expected
+
+    def test_quoted_column(self):
+        """Test tokenizing a quoted column name containing a token."""
+
+        assert _tokenize("'x == y' missing") == [
+            ("x == y", "QUOTED STRING"),
+            ("missing", "COMPARATOR"),
+        ]
+
+    @pytest.mark.parametrize(
+        "expression, expected",
+        [
+            ("x == 'open", ("open", "QUOTED STRING")),
+            ("x == 'open & y", ("open & y", "QUOTED STRING")),
+            ("x contains `^a", ("^a", "REGEX")),
+        ],
+    )
+    def test_unterminated_quote(self, expression, expected):
+        """Test whether an unterminated quote runs to the end."""
+
+        assert _tokenize(expression)[-1] == expected
+
+    @pytest.mark.parametrize(
+        "expression, expected",
+        [
+            ("x\\ y == 1", ("x y", "WORD")),
+            ("x\\&y == 1", ("x&y", "WORD")),
+            ("x\\(1\\) == 1", ("x(1)", "WORD")),
+        ],
+    )
+    def test_escaped_word(self, expression, expected):
+        """Test tokenizing words with escaped characters."""
+
+        assert _tokenize(expression)[0] == expected
+
+    @pytest.mark.parametrize(
+        "expression, expected",
+        [
+            ("android == 1", [("android", "WORD")]),
+            ("income_any == 1", [("income_any", "WORD")]),
+            ("missingness missing", [("missingness", "WORD")]),
+            ("notes missing", [("notes", "WORD")]),
+            ("sum x == 1", [("sum", "OPERATOR"), ("x", "WORD")]),
+            ("sum(x) == 1", [("sum", "OPERATOR"), ("(", "GROUP_OPEN")]),
+        ],
+    )
+    def test_word_boundary(self, expression, expected):
+        """Test whether tokens are only found as separate words."""
+
+        assert _tokenize(expression)[: len(expected)] == expected
+
+    def test_underscore_boundary(self):
+        """Test whether underscores end tokens, as punctuation characters."""
+
+        assert _tokenize("sum_x > 1")[:2] == [("sum", "OPERATOR"), ("_x", "WORD")]
+
+    @pytest.mark.parametrize(
+        "expression, expected",
+        [
+            ("x not missing", ("not missing", "COMPARATOR")),
+            ("x   not   missing", ("not", "WORD")),
+            ("x ranks in top 10", ("ranks in", "COMPARATOR")),
+            ("x is outlier by 2 SD", ("is outlier by", "COMPARATOR")),
+            ("x is outlier byte", ("is", "WORD")),
+        ],
+    )
+    def test_multi_word(self, expression, expected):
+        """Test tokenizing comparators consisting of several words."""
+
+        assert _tokenize(expression)[1] == expected
+
+    def test_longest_token(self):
+        """Test whether the longest matching token is found."""
+
+        assert _tokenize("x not missing")[1:] == [("not missing", "COMPARATOR")]
+        assert _tokenize("x >= 1")[1] == (">=", "COMPARATOR")
+
+    def test_class_defaults(self):
+        """Test whether additional types leave the class defaults unchanged."""
+
+        Tokenizer("x == 1", {"x": "OPERATOR"})
+        assert [(token.value, token.type) for token in Tokenizer("x")] == [
+            ("x", "WORD")
+        ]
+        assert _tokenize("x == 1")[0] == ("x", "WORD")
+
+
+class TestTokenCursor:
+    """Tests for moving over the tokens using a TokenCursor."""
+
+    def test_iterate(self):
+        """Test iterating over all tokens."""
+
+        tokenizer = Tokenizer("x == 1")
+        assert [token.value for token in tokenizer] == ["x", "==", "1"]
+
+    def test_peek(self):
+        """Test peeking ahead without moving the cursor."""
+
+        cursor = iter(Tokenizer("x == 1"))
+        assert cursor.peek().value == "x"
+        assert next(cursor).value == "x"
+        assert cursor.peek().value == "=="
+
+    def test_end(self):
+        """Test the cursor at the end of the tokens."""
+
+        cursor = iter(Tokenizer("x"))
+        assert cursor.has_next()
+        next(cursor)
+        assert not cursor.has_next()
+        assert cursor.peek() is None
+        with pytest.raises(StopIteration):
+            next(cursor)
+
+    def test_rewind(self):
+        """Test rewinding the cursor to earlier tokens."""
+
+        cursor = iter(Tokenizer("x == 1"))
+        next(cursor)
+        next(cursor)
+        cursor.rewind()
+        assert next(cursor).value == "=="
+        cursor.rewind(by=2)
+        assert next(cursor).value == "x"
+        with pytest.raises(ValueError, match="Cannot rewind"):
+            cursor.rewind(by=2)
+
+    def test_independent(self):
+        """Test whether several cursors move over the tokens independently."""
+
+        tokenizer = Tokenizer("x == 1")
+        first = iter(tokenizer)
+        next(first)
+        second = iter(tokenizer)
+        assert next(second).value == "x"
+        assert next(first).value == "=="
+
+    def test_continue(self):
+        """Test whether iterating a cursor continues from the current token."""
+
+        cursor = iter(Tokenizer("x == 1"))
+        next(cursor)
+        assert iter(cursor) is cursor
+        assert [token.value for token in cursor] == ["==", "1"]
@@ -0,0 +1,386 @@
+"""Module for unit testing the Validator class."""
+
+import gc
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from validata.comparators import Comparator
+from validata.parser import Parser
+from validata.validator import Validator
+
+# Dummy data for unit tests
+DUMMY_DATA = pd.DataFrame(
+    {
+        "int": [1, 2, 3],
+        "int_na": pd.array([1, None, 3], dtype="Int64"),
+        "float": [1.0, 2.2, 3.0],
+        "float32": np.array([1.0, 2.2, 3.0], dtype="float32"),
+        "str": ["1", "2.5", "3"],
+    }
+)
+
+
+def _validate(expressions, df=DUMMY_DATA, **kwargs):
+    """Validates data against the expressions, named after their position."""
+
+    checks = pd.DataFrame(
+        {"name": [str(i) for i in range(len(expressions))], "expression": expressions}
+    )
+    return Validator(checks).validate(df, **kwargs)
+
+
+@pytest.fixture
+def comparators():
+    """Restores the registered Comparators after a test registering others."""
+
+    registry = dict(Comparator._registry)
+    instances = dict(Comparator._instances)
+    yield
+    Comparator._registry.clear()
+    Comparator._registry.update(registry)
+    Comparator._instances.clear()
+    Comparator._instances.update(instances)
+
+
+class TestSharedComparisons:
+    """Tests for comparisons shared between validation checks."""
+
+    def _assert_unchanged(self, expression, others):
+        """Test whether adding other checks leaves the results unchanged."""
+
+        alone = _validate([expression])["0"]
+        shared = _validate([expression] + others)["0"]
+        pd.testing.assert_series_equal(shared, alone)
+
+    def test_int_and_string(self):
+        """Test sharing an equality check between int and string columns."""
+
+        self._assert_unchanged("int == 2.5", ["str == 2.5"])
+        assert _validate(["str == 2.5", "int == 2.5"])["0"].tolist() == [
+            False,
+            True,
+            False,
+        ]
+
+    def test_nullable_int(self):
+        """Test sharing an inequality check with a nullable int column."""
+
+        self._assert_unchanged("int_na != 2", ["str != 2"])
+
+    def test_float_precision(self):
+        """Test sharing a comparison between float32 and float64 columns."""
+
+        self._assert_unchanged("float32 > 2.2", ["float > 2.2"])
+        self._assert_unchanged("float > 2.2", ["float32 > 2.2"])
+
+
+class TestConfigurationErrors:
+    """Tests whether errors in validation checks raise, even if skipped."""
+
+    def test_missing_column(self):
+        """Test whether a missing column raises."""
+
+        with pytest.raises(RuntimeError, match="typo_col"):
+            _validate(["int > 100 & typo_col == 1"])
+
+    @pytest.mark.usefixtures("comparators")
+    def test_non_boolean_result(self):
+        """Test whether a check returning non-boolean values raises."""
+
+        # pylint: disable=unused-variable
+        class RatioComparator(Comparator):
+            """Divides the data by the target, returning floats."""
+
+            symbol = "ratio to"
+
+            def __call__(self, df, target):
+                return df / float(target)
+
+        with pytest.raises(TypeError, match="float64 values instead of booleans"):
+            _validate(["int > 1", "int ratio to 2"])
+
+    def test_missing_column_and_mode(self):
+        """Test whether a missing column raises when no rows are passing."""
+
+        with pytest.raises(RuntimeError, match="typo_col"):
+            _validate(["int > 100", "typo_col == 1"], mode="and")
+
+    def test_invalid_dtype_and_mode(self):
+        """Test whether an invalid data type raises when no rows are passing."""
+
+        with pytest.raises(TypeError, match="did not match dtype"):
+            _validate(["int > 100", "str > 1"], mode="and")
+
+    def test_duplicate_names(self):
+        """Test whether validation checks with the same name raise."""
+
+        checks = pd.DataFrame(
+            {"name": ["a", "b", "a"], "expression": ["int > 1", "int < 3", "int > 2"]}
+        )
+        with pytest.raises(RuntimeError, match="Duplicate names.*: a"):
+            Validator(checks)
+
+
+class TestPassingMode:
+    """Tests for evaluating checks only on rows passing earlier checks."""
+
+    data = pd.DataFrame(
+        {
+            "x": [1, 2, 3, 4, 5, 6, 7, 8],
+            "y": [8.0, None, 6.0, 5.0, None, 3.0, 2.0, 1.0],
+            "s": ["a", "b", "a", None, "b", "a", "b", "a"],
+        }
+    )
+
+    def _assert_running_and(self, expressions):
+        """Test whether results equal the running and of all-row results."""
+
+        result = _validate(expressions, self.data, mode="and")
+        expected = _validate(expressions, self.data).cumprod(axis=1).astype(bool)
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_rowwise(self):
+        """Test checks comparing each row on its own."""
+
+        self._assert_running_and(
+            ["x > 1", "y not missing", "s == a | y > 4", "x between 2:7", "y < 3"]
+        )
+
+    def test_not_rowwise(self):
+        """Test checks comparing rows to other rows, evaluated on all rows."""
+
+        self._assert_running_and(
+            ["x > 1", "y ranks in top 50%", "x ranks in bottom 4", "s != b"]
+        )
+
+    def test_no_passing_rows(self):
+        """Test checks after a check no rows are passing."""
+
+        self._assert_running_and(["x > 10", "y > 1", "x ranks in top 2"])
+
+    def test_unknown_mode(self):
+        """Test whether an unknown mode raises."""
+
+        with pytest.raises(ValueError, match="mode"):
+            _validate(["x > 1"], self.data, mode="or")
+
+
+class TestWorkers:
+    """Tests for evaluating checks in several threads."""
+
+    def test_same_results(self):
+        """Test whether threaded and sequential results are identical."""
+
+        data = pd.DataFrame(
+            {
+                "x": np.arange(200) % 7,
+                "y": np.where(np.arange(200) % 5 == 0, np.nan, np.arange(200.0)),
+                "z": np.arange(200) % 3,
+                "s": np.array(["a", "b", "c", "d"] * 50, dtype=object),
+            }
+        )
+        expressions = [
+            "x > 3",
+            "x > 3 & y missing",
+            "any x + z > 3",
+            "y ranks in top 10%",
+            "y is outlier by 1 SD",
+            "s == a | s == b",
+            "s != c & x > 1",
+            "sum x + z > 6",
+            "x == {z}",
+        ] * 3
+
+        sequential = _validate(expressions, data)
+        threaded = _validate(expressions, data, n_workers=4)
+        pd.testing.assert_frame_equal(threaded, sequential)
+
+
+class TestCachedResults:
+    """Tests for reusing results of earlier cached validations."""
+
+    @pytest.fixture
+    def evaluated(self, monkeypatch):
+        """Counts the number of evaluated expressions."""
+
+        counter = {"calls": 0}
+        evaluate_values = Parser.evaluate_values
+
+        def counting(parser, df, cache=None):
+            counter["calls"] += 1
+            return evaluate_values(parser, df, cache)
+
+        monkeypatch.setattr(Parser, "evaluate_values", counting)
+        return counter
+
+    @staticmethod
+    def _validator():
+        """Creates a Validator with two checks."""
+
+        checks = pd.DataFrame({"name": ["a", "b"], "expression": ["x > 1", "x < 3"]})
+        return Validator(checks)
+
+    def test_reuse(self, evaluated):
+        """Test whether results are reused for the same DataFrame."""
+
+        data = pd.DataFrame({"x": [1, 2, 3]})
+        validator = self._validator()
+        first = validator.validate(data, cached=True)
+        second = validator.validate(data, cached=True)
+        assert evaluated["calls"] == 2
+        pd.testing.assert_frame_equal(first, second)
+
+        # Results are copies, changing them leaves the cache unchanged
+        second.iloc[:, :] = False
+        pd.testing.assert_frame_equal(validator.validate(data, cached=True), first)
+
+    def test_not_cached(self, evaluated):
+        """Test whether results are only reused when asked for."""
+
+        data = pd.DataFrame({"x": [1, 2, 3]})
+        validator = self._validator()
+        validator.validate(data, cached=True)
+        validator.validate(data)
+        validator.validate(data, cached=True, mode="and")
+        assert evaluated["calls"] == 6
+
+    def test_eviction(self, evaluated):
+        """Test whether the least recently used results are dropped."""
+
+        validator = self._validator()
+        frames = [pd.DataFrame({"x": [i]}) for i in range(50)]
+        for data in frames:
+            validator.validate(data, cached=True)
+        assert evaluated["calls"] == 2 * len(frames)
+
+        validator.validate(frames[-1], cached=True)
+        assert evaluated["calls"] == 2 * len(frames)
+        validator.validate(frames[0], cached=True)
+        assert evaluated["calls"] == 2 * len(frames) + 2
+
+    def test_schema_change(self, evaluated):
+        """Test whether changing columns or dtypes invalidates results."""
+
+        data = pd.DataFrame({"x": [1, 2, 3]})
+        validator = self._validator()
+        validator.validate(data, cached=True)
+
+        data["x"] = data["x"].astype(float)
+        validator.validate(data, cached=True)
+        assert evaluated["calls"] == 4
+
+        data["y"] = 1
+        validator.validate(data, cached=True)
+        assert evaluated["calls"] == 6
+
+    def test_garbage_collected(self, evaluated):
+        """Test whether new DataFrames never reuse results of collected ones."""
+
+        validator = self._validator()
+        for i in range(20):
+            data = pd.DataFrame({"x": [i, i + 1, i + 2]})
+            expected = pd.DataFrame({"a": data["x"] > 1, "b": data["x"] < 3})
+            pd.testing.assert_frame_equal(
+                validator.validate(data, cached=True), expected
+            )
+
+            del data
+            gc.collect()
+
+        assert evaluated["calls"] == 2 * 20
+
+
+class TestParsers:
+    """Tests for parsing the expressions of validation checks."""
+
+    def test_two_schemas(self):
+        """Test validating one expression against data with other columns."""
+
+        first = pd.DataFrame({"x": [1, 2, 3], "y": [1, 1, 1]})
+        second = pd.DataFrame({"y": [3, 1, 2], "x_2": [0, 0, 0], "x": [3, 2, 1]})
+        expressions = ["x > 1", "any x* > 1"]
+
+        # A Validator validating both, and new Validators for each
+        validator = Validator(
+            pd.DataFrame({"name": ["0", "1"], "expression": expressions})
+        )
+        for data in (first, second, first):
+            expected = pd.DataFrame(
+                {"0": data["x"] > 1, "1": data["x"] > 1}, index=data.index
+            )
+            pd.testing.assert_frame_equal(validator.validate(data), expected)
+            pd.testing.assert_frame_equal(_validate(expressions, data), expected)
+
+    @pytest.mark.usefixtures("comparators")
+    def test_comparator_registered_later(self):
+        """Test whether new Validators recognize Comparators registered later."""
+
+        data = pd.DataFrame({"x": [1, 2, 3]})
+        with pytest.raises(RuntimeError, match="not found"):
+            _validate(["x is even"], data)
+
+        # pylint: disable=unused-variable
+        class EvenComparator(Comparator):
+            """Checks whether the data is even."""
+
+            symbol = "is even"
+
+            def __call__(self, df, target=None):
+                return df % 2 == 0
+
+        result = _validate(["x is even"], data)
+        assert result["0"].tolist() == [False, True, False]
+
+    def test_warning_filters(self):
+        """Test whether threads leave the warning filters unchanged."""
+
+        rows = np.arange(2000)
+        data = pd.DataFrame(
+            {f"x_{i}": np.where(rows % (i + 2) == 0, np.nan, 1.0) for i in range(40)}
+        )
+        expressions = [f"mean x_{i} + x_{i + 1} > 1" for i in range(39)]
+
+        filters = list(warnings.filters)
+        _validate(expressions, data, n_workers=8)
+        assert warnings.filters == filters
+
+
+class TestSummary:
+    """Tests for summarizing the last validation run."""
+
+    checks = pd.DataFrame(
+        {"name": ["gt_1", "gt_2"], "expression": ["int > 1", "int > 2"]}
+    )
+
+    @pytest.mark.parametrize(
+        "per, percentage, expected",
+        [
+            ("validation", False, pd.DataFrame({"positive": [2, 1]})),
+            (
+                "validation",
+                True,
+                pd.DataFrame({"percentage_positive": [200 / 3, 100 / 3]}),
+            ),
+            ("case", False, pd.DataFrame({"positive": [0, 1, 2]})),
+            ("case", True, pd.DataFrame({"percentage_positive": [0.0, 50.0, 100.0]})),
+        ],
+    )
+    def test_summary(self, per, percentage, expected):
+        """Test counts and percentages of positive results."""
+
+        validator = Validator(self.checks)
+        validator.validate(DUMMY_DATA)
+        summary = validator.get_summary(per=per, percentage=percentage)
+
+        if per == "validation":
+            expected.index = ["gt_1", "gt_2"]
+        pd.testing.assert_frame_equal(summary, expected, check_dtype=percentage)
+
+    def test_before_validate(self):
+        """Test whether summarizing before validating raises."""
+
+        with pytest.raises(RuntimeError, match="validate"):
+            Validator(self.checks).get_summary()